@@ -1,345 +1,994 @@
-import json
+import asyncio
+import base64
+import functools
+import hashlib
+import logging
+import math
 import os
-from pathlib import Path
+import weakref
+from collections.abc import Callable
 from typing import Any, cast
 
+import jsonpatch
 import litellm
+import orjson
 from dotenv import load_dotenv
 from litellm import Choices, ModelResponse
-from rich.console import Console
+from pydantic import TypeAdapter, ValidationError
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from resume_mate.ai.cache import ResponseCache
+from resume_mate.ai.prompt_compress import compress, dumps_schema
+from resume_mate.ai.router import cheap_model, select_model
+from resume_mate.core.merge import deterministic_merge
+from resume_mate.core.models import (
+    ENTITY_ADAPTERS,
+    ENTITY_MODELS,
+    MASTER_ADAPTER,
+    BaseSchema,
+    MasterProfile,
+)
+
+logger = logging.getLogger(__name__)
+
+# Provider errors worth retrying. Anything else (e.g. BadRequestError) fails fast.
+_TRANSIENT_ERRORS = (
+    litellm.RateLimitError,
+    litellm.APIConnectionError,
+    litellm.Timeout,
+    litellm.InternalServerError,
+    litellm.ServiceUnavailableError,
+)
+
+_retry_transient = retry(
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+    reraise=True,
+)
+
+
+@_retry_transient
+def _call_llm(**kwargs: Any) -> Any:
+    return litellm.completion(**kwargs)
+
+
+@_retry_transient
+async def _acall_llm(**kwargs: Any) -> Any:
+    return await litellm.acompletion(**kwargs)
+
+
+# An omitted section needing more cheap-model calls than this is replaced by a marker instead.
+MAX_SUMMARY_PIECES = 4
+
+# Ways a model-written patch can fail to apply or to produce a valid profile; these fall
+# back to the full-profile prompt. ValueError covers a string patch that is not valid JSON.
+_PATCH_ERRORS = (
+    jsonpatch.JsonPatchException,
+    jsonpatch.JsonPointerException,
+    ValidationError,
+    KeyError,
+    TypeError,
+    ValueError,
+)
+
+# Parses JSON-object responses that are not profiles (analyses, suggestions, entities, patches).
+_JSON_OBJECT = TypeAdapter(dict[str, Any])
+
+# Tailoring patches: {"patch": [...]} as requested, or the bare RFC 6902 operations array.
+_JSON_PATCH_RESPONSE = TypeAdapter(dict[str, Any] | list[Any])
+
+# Schema generation walks the whole model tree, so do it once at import time.
+# The schemas are minified since they are sent with every bootstrap/merge/extract call.
+_MASTER_SCHEMA_JSON = dumps_schema(MasterProfile.model_json_schema())
+_ENTITY_SCHEMA_JSON = {name: dumps_schema(cls.model_json_schema()) for name, cls in ENTITY_MODELS.items()}
+
+# Static prompt segments, compressed once at import. Schemas are joined in between them
+# unmodified, so every call sends byte-identical preambles that stay in the provider's
+# prefix cache, and per-call text is only ever appended with str.join.
+BOOTSTRAP_HEADER = compress("""
+    You are an expert Resume Parser and Career Strategist.
+    Your goal is to transform the raw resume text provided by the user (and images if provided) into a structured, high-quality 'Master Profile' JSON object.
+    This JSON object is the SINGLE SOURCE OF TRUTH for the candidate's career.
+    """)
+
+BOOTSTRAP_INSTRUCTIONS = compress("""
+    CRITICAL INSTRUCTIONS:
+    1. **Data Structure**: You MUST output a valid JSON object strictly adhering to the provided schema.
+    2. **Dates**: Convert ALL dates to `YYYY-MM` format. If a date is "Present" or "Current", omit the `endDate` (make it null).
+    3. **Summary**: If the resume lacks a professional summary, SYNTHESIZE a strong, 3-sentence summary based on the candidate's trajectory and key skills.
+    4. **Work Experience**:
+       - **Highlights**: Convert paragraph descriptions into crisp, result-oriented bullet points starting with strong action verbs (e.g., "Architected", "Deployed", "Led").
+       - **Tech Stack**: For EACH work entry, infer and populate the `techStack` list based on the tools/languages mentioned or implied in the description.
+    5. **Projects vs. Work**: Distinguish between professional employment (put in `work`) and side/academic projects (put in `projects`).
+    6. **Skills**: Extract ALL technical and soft skills found anywhere in the document.
+    7. **Completeness**: Do not truncate information. Capture all relevant details.
+    8. **Vision**: If images are provided, use them to understand layout, implied hierarchy, or details missed by text extraction.
+
+    Output ONLY the JSON object.
+    """)
+
+MERGE_HEADER = compress("""
+    You are an Expert Data Integrator for resumes.
+    Your task is to MERGE new resume data provided by the user into their existing 'Master Profile' JSON object.
+    """)
+
+MERGE_RULES = compress("""
+    MERGE RULES:
+    1. **MATCH & ENHANCE:** If a Work Experience or Project already exists (fuzzy match on Company/Project Name and Role), UPDATE it with new details (bullets, tech stack) from the new input. Do NOT create duplicates.
+    2. **ADD NEW:** If an entry found in the New Resume Input is NOT in the Current Profile, ADD it.
+    3. **PRESERVE:** Do NOT remove existing valid details (like old projects, specific bullets) unless the new text explicitly contradicts them or implies they are obsolete. The Master Profile should be a superset of history.
+    4. **BASICS UPDATE:** Update contact info, summary, or location if the new input seems more current.
+    5. **DATES:** Trust specific dates in the New Input if they are more precise than what is in the Current Profile.
+    6. **TECH STACK:** Merge lists of skills/technologies. Avoid duplicates.
+    7. **Output Structure:** You MUST output a valid JSON object strictly adhering to the schema.
+
+    Output ONLY the merged JSON object.
+    """)
+
+ENTITY_HEADER = compress("""
+    You are an expert resume data extractor.
+    Your task is to parse the text provided by the user and convert it into a valid JSON object
+    that conforms to the JSON Schema provided below.
+    """)
+
+ENTITY_INSTRUCTIONS = compress("""
+    Instructions:
+    1. Extract all relevant information and map it to the schema.
+    2. Ensure consistent formatting.
+    3. Return ONLY the JSON object.
+    """)
+
+# Serialized profiles, keyed by object identity. Profiles handed to the agent are
+# treated as immutable snapshots (every agent method returns a new MasterProfile).
+_profile_json_cache: dict[int, tuple[weakref.ref[MasterProfile], str]] = {}
+
+
+def _profile_json(profile: MasterProfile) -> str:
+    """Returns the prompt JSON for a profile, dumping it at most once per instance."""
+    key = id(profile)
+    cached = _profile_json_cache.get(key)
+    if cached is not None and cached[0]() is profile:
+        return cached[1]
+
+    # model_dump_json runs in pydantic-core and skips the intermediate dict.
+    text = profile.model_dump_json()
+    ref = weakref.ref(profile, lambda _, key=key: _profile_json_cache.pop(key, None))
+    _profile_json_cache[key] = (ref, text)
+    return text
+
+
+# Vision tokens grow with image area, so larger images are scaled down before sending.
+MAX_IMAGE_DIMENSION = 2048
+
+# Normalized image data URIs, keyed by the sha256 of the original URI. The same page images
+# are passed to bootstrap, merge and retries; they are decoded and resized only once.
+_image_cache: dict[str, str] = {}
+
+# Formats MuPDF can decode; others (e.g. WebP) are sent as they are.
+_RESIZABLE_IMAGE_TYPES = frozenset({"data:image/jpeg", "data:image/png", "data:image/gif", "data:image/bmp", "data:image/tiff"})
+
+
+def _normalize_image(image_url: str) -> str:
+    """Returns `image_url` with base64 images larger than MAX_IMAGE_DIMENSION downscaled (as JPEG)."""
+    key = hashlib.sha256(image_url.encode()).hexdigest()
+    cached = _image_cache.get(key)
+    if cached is not None:
+        return cached
+
+    normalized = image_url
+    header, sep, payload = image_url.partition(";base64,")
+    if sep and header in _RESIZABLE_IMAGE_TYPES:
+        # Imported lazily: only vision calls need it.
+        import pymupdf
 
-from resume_mate.core.models import MasterProfile
-
-console = Console()
+        try:
+            pix = pymupdf.Pixmap(base64.b64decode(payload))
+            scale = MAX_IMAGE_DIMENSION / max(pix.width, pix.height)
+            if scale < 1:
+                if pix.alpha:
+                    pix = pymupdf.Pixmap(pix, 0)
+                pix = pymupdf.Pixmap(pix, round(pix.width * scale), round(pix.height * scale), None)
+                encoded = base64.b64encode(pix.tobytes("jpeg", jpg_quality=90)).decode("ascii")
+                normalized = f"data:image/jpeg;base64,{encoded}"
+        except Exception as e:
+            logger.warning("Could not resize image, sending it unchanged: %s", e)
+
+    _image_cache[key] = normalized
+    return normalized
+
+
+def _split_head_tail(text: str, keep_chars: int) -> tuple[str, str, str]:
+    """
+    Splits `text` into (head, middle, tail) so that head + tail is about `keep_chars` long.
+    Cuts fall on paragraph boundaries where possible (then line breaks); about 60% of the
+    kept text comes from the head, where resumes put contact details and recent roles.
+    """
+    if keep_chars >= len(text):
+        return text, "", ""
+    keep_chars = max(keep_chars, 0)
+
+    head_target = int(keep_chars * 0.6)
+    head_end = text.rfind("\n\n", 0, head_target)
+    if head_end <= 0:
+        head_end = text.rfind("\n", 0, head_target)
+    if head_end <= 0:
+        head_end = head_target
+
+    tail_target = max(len(text) - (keep_chars - head_end), head_end)
+    tail_start = text.find("\n\n", tail_target)
+    if tail_start == -1:
+        tail_start = text.find("\n", tail_target)
+    if tail_start == -1:
+        tail_start = tail_target
+
+    return text[:head_end], text[head_end:tail_start], text[tail_start:]
+
+
+class _JsonKeyProgress:
+    """
+    Scans streamed JSON text incrementally and reports each top-level key
+    once its value has been fully received.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._capturing = False
+        self._buffer: list[str] = []
+        self._key: str | None = None
+
+    def feed(self, text: str) -> list[str]:
+        completed = []
+        for ch in text:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._capturing:
+                        self._key = "".join(self._buffer)
+                        self._capturing = False
+                elif self._capturing:
+                    self._buffer.append(ch)
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._capturing = True
+                    self._expect_key = False
+                    self._buffer = []
+            elif ch in "{[":
+                self._depth += 1
+                self._expect_key = self._depth == 1
+            elif ch in "}]":
+                if self._depth == 1 and self._key is not None:
+                    completed.append(self._key)
+                    self._key = None
+                self._depth -= 1
+            elif ch == "," and self._depth == 1:
+                if self._key is not None:
+                    completed.append(self._key)
+                    self._key = None
+                self._expect_key = True
+        return completed
 
 
 class ResumeAgent:
-    def __init__(self, model_name: str = "gpt-5.2", api_key: str | None = None, api_base: str | None = None):
+    # The static part of every prompt (role, instructions, schema) lives in a leading
+    # system message that is identical across calls, so providers can serve it from
+    # their prompt-prefix cache. Only the per-call payload goes in the user message.
+    ANALYZE_PREAMBLE = compress("""
+        You are an expert technical recruiter and resume strategist.
+        Analyze the job description provided by the user and extract:
+        1. Key technical skills required.
+        2. Soft skills and cultural fit indicators.
+        3. The core mission or primary objective of the role.
+        4. Important keywords for ATS optimization.
+
+        Return the result as a valid JSON object with keys:
+        "technical_skills" (list of strings),
+        "soft_skills" (list of strings),
+        "role_mission" (string),
+        "keywords" (list of strings).
+        """)
+
+    BOOTSTRAP_PREAMBLE = "\n".join((BOOTSTRAP_HEADER, "MasterProfile JSON Schema:", _MASTER_SCHEMA_JSON, BOOTSTRAP_INSTRUCTIONS))
+
+    SUGGEST_PREAMBLE = compress("""
+        You are a senior resume consultant and professional resume critic.
+        Analyze the Candidate Master Profile below and identify:
+        1. Gaps in information (e.g., missing tech stacks, brief summaries).
+        2. Suggestions for improving bullet points (making them more result-oriented).
+        3. Potential skills to add based on the candidate's experience.
+        4. Overall professional impression.
+
+        Return the result as a valid JSON object with keys:
+        "gaps" (list of strings),
+        "suggestions" (list of strings),
+        "recommended_skills" (list of strings),
+        "overall_critique" (string).
+        """)
+
+    TAILOR_PREAMBLE = compress("""
+        You are a professional resume writer. Your goal is to tailor a candidate's profile to a specific job description.
+        The Candidate Master Profile is given below; the user provides the Job Analysis and the Target Language.
+
+        Instructions:
+        1. **Summary:** Rewrite the candidate's summary (`basics.summary`) to align with the Role Mission and Keywords. Keep it professional and under 4 lines.
+        2. **Work Experience:**
+           - Select the most relevant work experiences.
+           - For each selected experience, rewrite the `highlights` to emphasize skills and achievements relevant to the JD.
+           - Use the keywords from the analysis.
+           - Keep the original `company`, `position`, `startDate`, `endDate`.
+           - You may reorder the highlights.
+        3. **Skills:** Select and prioritize the `skills` list to match the JD's technical requirements.
+        4. **Language:** Ensure the entire resume (summary, bullets, etc.) is written in the Target Language. If the JD is in a different language, TRANSLATE relevant parts to the Target Language.
+
+        Return the tailored profile as a JSON object matching the structure of the input Master Profile.
+        ENSURE all fields required by the schema (like 'basics', 'work', 'education', 'skills') are present and correctly formatted.
+        """)
+
+    TAILOR_PATCH_PREAMBLE = compress("""
+        You are a professional resume writer. Your goal is to tailor a candidate's profile to a specific job description.
+        The Candidate Master Profile is given below as JSON; the user provides the Job Analysis and the Target Language.
+
+        Instructions:
+        1. **Summary:** Rewrite the candidate's summary (`basics.summary`) to align with the Role Mission and Keywords. Keep it professional and under 4 lines.
+        2. **Work Experience:**
+           - Keep only the most relevant work experiences.
+           - For each kept experience, rewrite the `highlights` to emphasize skills and achievements relevant to the JD.
+           - Use the keywords from the analysis.
+           - Never change the company name, position or dates.
+           - You may reorder the highlights.
+        3. **Skills:** Select and prioritize the `skills` list to match the JD's technical requirements.
+        4. **Language:** Ensure the entire resume (summary, bullets, etc.) is written in the Target Language. If the JD is in a different language, TRANSLATE relevant parts to the Target Language.
+
+        Do NOT return the tailored profile. Return ONLY the edits, as a JSON object {"patch": [...]}
+        where "patch" is a list of RFC 6902 JSON Patch operations ("add", "remove", "replace", "move")
+        against the Candidate Master Profile. Paths use the snake_case keys exactly as they appear in
+        that JSON, such as "/basics/summary", "/work/0/highlights" or "/work/0/tech_stack", not the
+        camelCase schema names. Operations are applied in order, so indexes shift after a "remove" or "move".
+        """)
+
+    SUMMARIZE_PREAMBLE = compress("""
+        You condense an excerpt from the middle of a resume that is too long for the model's context window.
+        Keep every employer, role, project, institution, date and named technology; drop filler wording.
+        Return a valid JSON object with a single key "summary" (string).
+        """)
+
+    MERGE_PREAMBLE = "\n".join((MERGE_HEADER, "MasterProfile JSON Schema:", _MASTER_SCHEMA_JSON, MERGE_RULES))
+
+    MERGE_CONFLICTS_PREAMBLE = compress("""
+        You resolve conflicts found while merging new resume data into an existing Master Profile.
+        Each conflict has a JSON Pointer "path", the "current" value in the profile and the "incoming" value from the new resume.
+
+        RESOLUTION RULES:
+        1. **BASICS:** Prefer the incoming contact info, summary or location if it seems more current.
+        2. **DATES:** An empty end date means "present". Prefer the incoming date if the new resume is more recent or more precise.
+        3. **TEXT:** For descriptions and summaries you may combine both values if each adds details.
+
+        Return a valid JSON object {"resolutions": [{"path": "...", "value": ...}]} with one entry per conflict, using the paths exactly as given.
+        """)
+
+    def __init__(
+        self,
+        model_name: str = "gpt-5.2",
+        api_key: str | None = None,
+        api_base: str | None = None,
+        use_cache: bool = True,
+        stream: bool = True,
+        route_simple_tasks: bool = True,
+        semantic_cache_threshold: float | None = None,
+    ):
         self.model_name = model_name
         # Prioritize passed key, then LITELLM_API_KEY, then OPENAI_API_KEY
         self.api_key = api_key or os.getenv("LITELLM_API_KEY") or os.getenv("OPENAI_API_KEY")
         # Prioritize passed base, then LITELLM_PROXY_BASE_URL
         self.api_base = api_base or os.getenv("LITELLM_PROXY_BASE_URL")
-        
+        # Identical requests are answered from disk instead of the network. Near-identical ones
+        # (e.g. a re-pasted JD with whitespace edits) also hit when a semantic threshold is set,
+        # here or via RESUMEMATE_SEMANTIC_CACHE; 0.92 cosine similarity is a reasonable value.
+        if semantic_cache_threshold is None and os.getenv("RESUMEMATE_SEMANTIC_CACHE"):
+            semantic_cache_threshold = float(os.environ["RESUMEMATE_SEMANTIC_CACHE"])
+        self.cache = (
+            ResponseCache(
+                semantic_threshold=semantic_cache_threshold, api_key=self.api_key, api_base=self.api_base
+            )
+            if use_cache
+            else None
+        )
+        # Stream responses so large outputs report progress while they are decoded.
+        self.stream = stream
+        # Send simple extractions to a cheaper model of the same family.
+        self.route_simple_tasks = route_simple_tasks
+
         if not self.api_key:
-            console.print("[yellow]Warning: No API key provided or found in environment variables.[/yellow]")
+            logger.warning("No API key provided or found in environment variables.")
+
+    @staticmethod
+    @functools.cache
+    def _entity_preamble(entity_type: str) -> str:
+        """Builds (once per entity type) the static system prompt for `extract_entity`."""
+        return "\n".join((ENTITY_HEADER, f"{entity_type} JSON Schema:", _ENTITY_SCHEMA_JSON[entity_type], ENTITY_INSTRUCTIONS))
+
+    def _supports_cache_control(self) -> bool:
+        """Anthropic-family models need an explicit cache breakpoint; OpenAI caches prefixes automatically."""
+        return "claude" in self.model_name.lower() or self.model_name.startswith("anthropic/")
+
+    def _build_messages(
+        self,
+        preamble: str,
+        user_text: str,
+        images: list[str] | None = None,
+        context: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Puts the static preamble first (cache-marked where supported) and the dynamic payload last.
+        `context` is per-user data that is stable across calls (e.g. the profile); it follows the
+        preamble in the system message so it is cached as well.
+        """
+        blocks = [preamble] if context is None else [preamble, context]
+        if self._supports_cache_control():
+            system: dict[str, Any] = {
+                "role": "system",
+                "content": [
+                    {"type": "text", "text": block, "cache_control": {"type": "ephemeral"}} for block in blocks
+                ],
+            }
+        else:
+            system = {"role": "system", "content": "\n\n".join(blocks)}
 
-    def _get_completion(self, messages: list[dict[str, str]], json_mode: bool = True) -> Any:
-        """Helper to call LiteLLM and parse JSON response."""
-        try:
-            response = litellm.completion(
-                model=self.model_name,
-                messages=messages,
-                api_key=self.api_key,
-                api_base=self.api_base,
-                response_format={"type": "json_object"} if json_mode else None,
-                stream=False,
-            )
-            # Cast to ModelResponse to satisfy type checker
-            resp = cast(ModelResponse, response)
+        if images:
+            # Multimodal message construction
+            content: list[dict[str, Any]] = [{"type": "text", "text": user_text}]
+            for img_url in images:
+                content.append({"type": "image_url", "image_url": {"url": _normalize_image(img_url)}})
+            return [system, {"role": "user", "content": content}]
+
+        return [system, {"role": "user", "content": user_text}]
+
+    def _select_model(self, task: str, messages: list[dict[str, Any]] | None = None) -> str:
+        if not self.route_simple_tasks:
+            return self.model_name
+        return select_model(task, self.model_name, messages=messages, api_base=self.api_base)
+
+    def _request_kwargs(self, messages: list[dict[str, Any]], model: str | None = None) -> dict[str, Any]:
+        """Arguments shared by the sync, async and batched LiteLLM calls."""
+        return {
+            "model": model or self.model_name,
+            "messages": messages,
+            "api_key": self.api_key,
+            "api_base": self.api_base,
+            "response_format": {"type": "json_object"},
+        }
 
-            if not resp.choices:
-                raise ValueError("LLM returned no choices")
+    @staticmethod
+    def _response_content(response: Any) -> str:
+        """Extracts the message content from a LiteLLM response."""
+        # Cast to ModelResponse to satisfy type checker
+        resp = cast(ModelResponse, response)
+
+        if not resp.choices:
+            raise ValueError("LLM returned no choices")
+
+        # Cast choice to Choices to avoid StreamingChoices warnings
+        choice = cast(Choices, resp.choices[0])
+        content = choice.message.content
+
+        if content is None:
+            raise ValueError("LLM returned no content")
+        return content
+
+    def _cache_get(self, messages: list[dict[str, Any]], model: str | None = None) -> str | None:
+        if self.cache is None:
+            return None
+        return self.cache.get(messages, model or self.model_name)
+
+    def _cache_set(self, messages: list[dict[str, Any]], content: str, model: str | None = None) -> None:
+        if self.cache is not None:
+            self.cache.set(messages, model or self.model_name, content)
+
+    def _get_completion[T](
+        self,
+        messages: list[dict[str, Any]],
+        adapter: TypeAdapter[T],
+        show_progress: bool = False,
+        model: str | None = None,
+    ) -> T:
+        """
+        Helper to call LiteLLM in JSON mode and validate the raw response with `adapter`.
+        Validation runs in one pydantic-core pass over the response text, with no
+        intermediate `json.loads` dict. `model` overrides the agent's configured model.
+        """
+        cached = self._cache_get(messages, model)
+        if cached is not None:
+            return adapter.validate_json(cached)
 
-            # Cast choice to Choices to avoid StreamingChoices warnings
-            choice = cast(Choices, resp.choices[0])
-            content = choice.message.content
+        try:
+            if self.stream:
+                content = self._stream_content(messages, show_progress, model)
+            else:
+                response = _call_llm(**self._request_kwargs(messages, model), stream=False)
+                content = self._response_content(response)
+            result = adapter.validate_json(content)
+        except Exception as e:
+            logger.error("Error calling LLM: %s", e)
+            raise
 
-            if content is None:
-                raise ValueError("LLM returned no content")
+        # Only responses that validated are worth caching.
+        self._cache_set(messages, content, model)
+        return result
+
+    def _stream_content(self, messages: list[dict[str, Any]], show_progress: bool, model: str | None = None) -> str:
+        """Streams a completion, reporting top-level JSON keys as they complete."""
+        response = _call_llm(**self._request_kwargs(messages, model), stream=True)
+        progress = _JsonKeyProgress() if show_progress else None
+        parts = []
+        for chunk in response:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            if progress is not None:
+                for key in progress.feed(delta):
+                    logger.info("  received '%s'", key)
+
+        if not parts:
+            raise ValueError("LLM returned no content")
+        return "".join(parts)
+
+    async def _get_completion_async[T](
+        self, messages: list[dict[str, Any]], adapter: TypeAdapter[T], model: str | None = None
+    ) -> T:
+        """Async counterpart of `_get_completion`, so independent calls can run concurrently."""
+        cached = self._cache_get(messages, model)
+        if cached is not None:
+            return adapter.validate_json(cached)
 
-            if json_mode:
-                return json.loads(content)
-            return content
+        try:
+            response = await _acall_llm(**self._request_kwargs(messages, model), stream=False)
+            content = self._response_content(response)
+            result = adapter.validate_json(content)
         except Exception as e:
-            console.print(f"[bold red]Error calling LLM:[/bold red] {e}")
+            logger.error("Error calling LLM: %s", e)
             raise
 
+        self._cache_set(messages, content, model)
+        return result
+
+    def _analyze_messages(self, jd_text: str) -> list[dict[str, Any]]:
+        return self._build_messages(self.ANALYZE_PREAMBLE, "\n".join(("Job Description:", jd_text)))
+
     def analyze_job_description(self, jd_text: str) -> dict[str, Any]:
         """
         Analyzes the JD to extract keywords, required skills, and key themes.
         """
-        prompt = f"""
-        You are an expert technical recruiter and resume strategist.
-        Analyze the following job description and extract:
-        1. Key technical skills required.
-        2. Soft skills and cultural fit indicators.
-        3. The core mission or primary objective of the role.
-        4. Important keywords for ATS optimization.
+        messages = self._analyze_messages(jd_text)
+        return self._get_completion(
+            messages=messages,
+            adapter=_JSON_OBJECT,
+            model=self._select_model("analyze_job_description", messages),
+        )
 
-        Job Description:
-        {jd_text}
+    async def analyze_job_description_async(self, jd_text: str) -> dict[str, Any]:
+        """
+        Async variant of `analyze_job_description`.
+        """
+        messages = self._analyze_messages(jd_text)
+        return await self._get_completion_async(
+            messages, _JSON_OBJECT, model=self._select_model("analyze_job_description", messages)
+        )
 
-        Return the result as a valid JSON object with keys: 
-        "technical_skills" (list of strings), 
-        "soft_skills" (list of strings), 
-        "role_mission" (string), 
-        "keywords" (list of strings).
+    async def analyze_many(self, jd_texts: list[str], max_concurrency: int = 4) -> list[dict[str, Any]]:
         """
-        
-        return self._get_completion(
-            messages=[{"role": "user", "content": prompt}],
-            json_mode=True
+        Analyzes several job descriptions concurrently.
+
+        At most `max_concurrency` requests are in flight at once; transient provider errors
+        are retried with jittered backoff. Results are returned in the same order as `jd_texts`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _analyze_one(jd_text: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_job_description_async(jd_text)
+
+        return list(await asyncio.gather(*(_analyze_one(jd_text) for jd_text in jd_texts)))
+
+    def _get_completions_batch(
+        self,
+        messages_list: list[list[dict[str, Any]]],
+        adapters: list[TypeAdapter[Any]],
+        model: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> list[Any]:
+        """
+        Sends several requests through one `litellm.batch_completion` call, which dispatches
+        them concurrently. Each response is validated with the adapter at the same index.
+        Cached responses are not re-requested.
+        """
+        results: list[Any] = [None] * len(messages_list)
+        missing = []
+        for i, messages in enumerate(messages_list):
+            cached = self._cache_get(messages, model)
+            if cached is None:
+                missing.append(i)
+            else:
+                results[i] = adapters[i].validate_json(cached)
+
+        if missing:
+            kwargs = self._request_kwargs([], model)
+            kwargs["messages"] = [messages_list[i] for i in missing]
+            if max_concurrency is not None:
+                # Keeps a large batch under the provider's requests-per-minute limit.
+                kwargs["max_workers"] = max_concurrency
+            responses = litellm.batch_completion(**kwargs)
+
+            for i, response in zip(missing, responses, strict=True):
+                try:
+                    # batch_completion returns the exception object in place of a failed response
+                    if isinstance(response, _TRANSIENT_ERRORS):
+                        response = _call_llm(**self._request_kwargs(messages_list[i], model))
+                    elif isinstance(response, Exception):
+                        raise response
+                    content = self._response_content(response)
+                    results[i] = adapters[i].validate_json(content)
+                except Exception as e:
+                    logger.error("Error calling LLM: %s", e)
+                    raise
+                self._cache_set(messages_list[i], content, model)
+
+        return results
+
+    @staticmethod
+    def _largest_prompt(messages_list: list[list[dict[str, Any]]]) -> list[dict[str, Any]] | None:
+        """The request with the longest user message; batches pick one model against it."""
+        return max(messages_list, key=lambda messages: len(messages[-1]["content"]), default=None)
+
+    def analyze_batch(self, jd_texts: list[str], max_concurrency: int | None = None) -> list[dict[str, Any]]:
+        """
+        Analyzes several job descriptions with a single `litellm.batch_completion` call,
+        which dispatches the requests concurrently. Cached analyses are not re-requested.
+        """
+        messages_list = [self._analyze_messages(jd_text) for jd_text in jd_texts]
+        model = self._select_model("analyze_job_description", self._largest_prompt(messages_list))
+        return self._get_completions_batch(
+            messages_list, [_JSON_OBJECT] * len(messages_list), model, max_concurrency
+        )
+
+    def _fit_context(
+        self,
+        build: Callable[[str], list[dict[str, Any]]],
+        text: str,
+        model: str | None = None,
+        headroom: int = 2048,
+    ) -> list[dict[str, Any]]:
+        """
+        Builds the messages for `text` and makes sure they fit the model's context window
+        (leaving `headroom` tokens for the response), instead of letting the provider
+        truncate and return broken JSON.
+
+        If the prompt is too long, the middle of `text` is cut at paragraph boundaries,
+        keeping its head and tail; the removed part is replaced by a summary from a cheaper
+        model when that still fits, else by a short marker. Raises ValueError if even the
+        trimmed prompt does not fit.
+        """
+        model = model or self.model_name
+        messages = build(text)
+        try:
+            limit = litellm.get_model_info(model).get("max_input_tokens")
+            tokens = litellm.token_counter(model=model, messages=messages)
+        except Exception:
+            # Unknown model (e.g. a proxy alias): nothing to check against.
+            return messages
+        if not limit or tokens + headroom <= limit:
+            return messages
+
+        budget = limit - headroom
+        logger.warning(
+            "Prompt is %d tokens, over the %d token budget for %s. Trimming the middle of the input text.",
+            tokens,
+            budget,
+            model,
         )
 
+        keep_chars = len(text)
+        for _ in range(5):
+            keep_chars = int(keep_chars * budget / tokens * 0.9)
+            head, middle, tail = _split_head_tail(text, keep_chars)
+            marker = f"\n\n[... {len(middle)} characters omitted to fit the context window ...]\n\n"
+            messages = build(head + marker + tail)
+            tokens = litellm.token_counter(model=model, messages=messages)
+            if tokens <= budget:
+                break
+        else:
+            raise ValueError(f"Prompt does not fit the context window of {model}, even after trimming the input text.")
+
+        summary = self._summarize_excerpt(middle)
+        if summary:
+            summarized = build(f"{head}\n\n[Summary of omitted section]\n{summary}\n\n{tail}")
+            if litellm.token_counter(model=model, messages=summarized) <= budget:
+                return summarized
+        return messages
+
+    def _summarize_excerpt(self, text: str, headroom: int = 1024) -> str | None:
+        """
+        Summarizes a cut-out section with the cheap model, split into pieces that fit its
+        context window. The excerpt is about as large as the overflow, so the configured
+        model would overflow again; without a cheap model nothing is summarized.
+        Returns None if there is no cheap model, too many pieces are needed, or a call fails.
+        """
+        model = cheap_model(self.model_name, api_base=self.api_base) if self.route_simple_tasks else None
+        if model is None:
+            return None
+
+        def build(excerpt: str) -> list[dict[str, Any]]:
+            return self._build_messages(self.SUMMARIZE_PREAMBLE, "\n".join(("Excerpt:", excerpt)))
+
+        pieces = 1
+        try:
+            limit = litellm.get_model_info(model).get("max_input_tokens")
+            tokens = litellm.token_counter(model=model, messages=build(text))
+        except Exception:
+            # Unknown model (e.g. a RESUMEMATE_CHEAP_MODEL proxy alias): send it whole.
+            limit = None
+        if limit and tokens + headroom > limit:
+            pieces = math.ceil(tokens / (limit - headroom) * 1.1)
+        if pieces > MAX_SUMMARY_PIECES:
+            return None
+
+        size = math.ceil(len(text) / pieces)
+        summaries = []
+        for start in range(0, len(text), size):
+            try:
+                result = self._get_completion(messages=build(text[start : start + size]), adapter=_JSON_OBJECT, model=model)
+            except Exception:
+                return None
+            summary = result.get("summary")
+            if not isinstance(summary, str):
+                return None
+            summaries.append(summary)
+        return "\n".join(summaries)
+
     def bootstrap_profile(self, raw_text: str, images: list[str] | None = None) -> MasterProfile:
         """
-        Extracts candidate information from raw text (e.g., an old resume) 
+        Extracts candidate information from raw text (e.g., an old resume)
         and maps it to the MasterProfile schema.
-        
+
         Args:
             raw_text: Text extracted from the file.
             images: Optional list of base64 data URIs (for Vision models).
         """
-        schema = MasterProfile.model_json_schema()
-        
-        prompt_text = f"""
-        You are an expert Resume Parser and Career Strategist.
-        Your goal is to transform the provided raw resume text (and images if provided) into a structured, high-quality 'Master Profile' JSON object.
-        This JSON object is the SINGLE SOURCE OF TRUTH for the candidate's career.
-
-        Raw Resume Text:
-        {raw_text}
-
-        MasterProfile JSON Schema:
-        {json.dumps(schema, indent=2)}
-
-        CRITICAL INSTRUCTIONS:
-        1. **Data Structure**: You MUST output a valid JSON object strictly adhering to the provided schema.
-        2. **Dates**: Convert ALL dates to `YYYY-MM` format. If a date is "Present" or "Current", omit the `endDate` (make it null).
-        3. **Summary**: If the resume lacks a professional summary, SYNTHESIZE a strong, 3-sentence summary based on the candidate's trajectory and key skills.
-        4. **Work Experience**:
-           - **Highlights**: Convert paragraph descriptions into crisp, result-oriented bullet points starting with strong action verbs (e.g., "Architected", "Deployed", "Led").
-           - **Tech Stack**: For EACH work entry, infer and populate the `techStack` list based on the tools/languages mentioned or implied in the description.
-        5. **Projects vs. Work**: Distinguish between professional employment (put in `work`) and side/academic projects (put in `projects`).
-        6. **Skills**: Extract ALL technical and soft skills found anywhere in the document.
-        7. **Completeness**: Do not truncate information. Capture all relevant details.
-        8. **Vision**: If images are provided, use them to understand layout, implied hierarchy, or details missed by text extraction.
-
-        Output ONLY the JSON object.
-        """
-
-        if images:
-            # Multimodal message construction
-            content = [{"type": "text", "text": prompt_text}]
-            for img_url in images:
-                content.append({"type": "image_url", "image_url": {"url": img_url}})
-            
-            messages = [
-                {"role": "system", "content": "You are a helpful assistant that extracts resume data into structured JSON."},
-                {"role": "user", "content": content}
-            ]
-        else:
-            # Standard text-only
-            messages = [
-                {"role": "system", "content": "You are a helpful assistant that extracts resume data into structured JSON."},
-                {"role": "user", "content": prompt_text}
-            ]
+        messages = self._fit_context(
+            lambda text: self._build_messages(self.BOOTSTRAP_PREAMBLE, "\n".join(("Raw Resume Text:", text)), images=images),
+            raw_text,
+        )
 
-        profile_data = self._get_completion(
+        return self._get_completion(
             messages=messages,
-            json_mode=True
+            adapter=MASTER_ADAPTER,
+            show_progress=True,
         )
 
-        return MasterProfile(**profile_data)
+    def _entity_messages(self, text: str, entity_type: str) -> list[dict[str, Any]]:
+        return self._build_messages(self._entity_preamble(entity_type), "\n".join(("Input Text:", text)))
 
     def extract_entity(self, text: str, entity_type: str) -> dict[str, Any]:
         """
         Extracts a specific entity (WorkExperience, Project, etc.) from natural language text.
         """
-        from resume_mate.core.models import WorkExperience, Project, Education, Skill
-        
-        type_map = {
-            "work": WorkExperience,
-            "project": Project,
-            "education": Education,
-            "skill": Skill
-        }
-        
-        if entity_type not in type_map:
+        if entity_type not in ENTITY_MODELS:
             raise ValueError(f"Unsupported entity type: {entity_type}")
-            
-        model_class = type_map[entity_type]
-        schema = model_class.model_json_schema()
-        
-        prompt = f"""
-        You are an expert resume data extractor. 
-        Your task is to parse the following text and convert it into a valid JSON object 
-        that conforms to the {entity_type} schema provided below.
 
-        Input Text:
-        {text}
+        messages = self._entity_messages(text, entity_type)
+        return self._get_completion(
+            messages=messages,
+            adapter=_JSON_OBJECT,
+            model=self._select_model(f"extract_entity.{entity_type}", messages),
+        )
 
-        JSON Schema:
-        {json.dumps(schema, indent=2)}
+    def extract_entities(
+        self, items: list[tuple[str, str]], max_concurrency: int | None = None
+    ) -> list[BaseSchema]:
+        """
+        Extracts several entities at once from `(text, entity_type)` pairs.
 
-        Instructions:
-        1. Extract all relevant information and map it to the schema.
-        2. Ensure consistent formatting.
-        3. Return ONLY the JSON object.
+        All requests go out in a single `litellm.batch_completion` call, so latency is
+        roughly one round-trip instead of one per item. Each result is validated into the
+        model for its entity type; results are returned in the order of `items`.
         """
-        
-        return self._get_completion(
-            messages=[{"role": "system", "content": f"You extract {entity_type} data into structured JSON."},
-                      {"role": "user", "content": prompt}],
-            json_mode=True
-        )
+        for _, entity_type in items:
+            if entity_type not in ENTITY_MODELS:
+                raise ValueError(f"Unsupported entity type: {entity_type}")
+
+        messages_list = [self._entity_messages(text, entity_type) for text, entity_type in items]
+        adapters = [ENTITY_ADAPTERS[entity_type] for _, entity_type in items]
+        model = None
+        if items:
+            largest = self._largest_prompt(messages_list)
+            model = self._select_model(f"extract_entity.{items[0][1]}", largest)
+        return self._get_completions_batch(messages_list, adapters, model, max_concurrency)
 
     def suggest_improvements(self, profile: MasterProfile) -> dict[str, Any]:
         """
         Analyzes the Master Profile and suggests improvements or identifies gaps.
         """
-        profile_dict = profile.model_dump(mode="json")
-        
-        prompt = f"""
-        You are a senior resume consultant. 
-        Analyze the following candidate Master Profile and identify:
-        1. Gaps in information (e.g., missing tech stacks, brief summaries).
-        2. Suggestions for improving bullet points (making them more result-oriented).
-        3. Potential skills to add based on the candidate's experience.
-        4. Overall professional impression.
-
-        Candidate Master Profile:
-        {json.dumps(profile_dict, indent=2)}
-
-        Return the result as a valid JSON object with keys:
-        "gaps" (list of strings),
-        "suggestions" (list of strings),
-        "recommended_skills" (list of strings),
-        "overall_critique" (string).
-        """
-        
         return self._get_completion(
-            messages=[{"role": "system", "content": "You are a professional resume critic."},
-                      {"role": "user", "content": prompt}],
-            json_mode=True
+            messages=self._build_messages(
+                self.SUGGEST_PREAMBLE,
+                "Review the Candidate Master Profile.",
+                context="\n".join(("Candidate Master Profile:", _profile_json(profile))),
+            ),
+            adapter=_JSON_OBJECT,
         )
 
     def tailor_profile(self, profile: MasterProfile, jd_analysis: dict[str, Any], language: str = "English") -> MasterProfile:
         """
         Tailors the Master Profile to fit the analyzed job description.
         Currently focuses on rewriting the summary and filtering/rewriting work experience.
-        """
-        
-        # 1. Tailor the Summary (Basics)
-        # 2. Tailor Work Experience (Rewriting highlights)
-        
-        # For this implementation, we will perform a holistic tailoring of the work experience.
-        # We'll ask the LLM to select the most relevant work entries and rewrite their highlights.
-        
-        # Convert profile to dict for the prompt (excluding some fields to save tokens if needed)
-        profile_dict = profile.model_dump(mode="json")
-        
-        prompt = f"""
-        You are a professional resume writer. Your goal is to tailor a candidate's profile to a specific job description.
 
-        Job Analysis:
-        {json.dumps(jd_analysis, indent=2)}
+        The LLM returns a JSON Patch against the profile rather than the whole tailored
+        profile, which keeps the output a fraction of the profile's size. If the patch does
+        not apply or does not validate, the full-profile prompt is used instead.
+        """
+        profile_json = _profile_json(profile)
+        # The profile sits in the cached system context: it is the same across job descriptions.
+        context = "\n".join(("Candidate Master Profile:", profile_json))
+        user_text = "\n".join(("Job Analysis:", orjson.dumps(jd_analysis).decode(), "", f"Target Language: {language}"))
 
-        Candidate Master Profile:
-        {json.dumps(profile_dict, indent=2)}
-        
-        Target Language: {language}
+        try:
+            patch_data = self._get_completion(
+                messages=self._build_messages(self.TAILOR_PATCH_PREAMBLE, user_text, context=context),
+                adapter=_JSON_PATCH_RESPONSE,
+            )
+            # Without enforced JSON mode (e.g. Ollama, some proxies) a bare operations array comes back.
+            operations = patch_data if isinstance(patch_data, list) else patch_data["patch"]
+            if not isinstance(operations, list):
+                # apply_patch would parse a string as a JSON document instead of rejecting it.
+                raise TypeError(f"'patch' is a {type(operations).__name__}, not a list of operations")
+            patched = jsonpatch.apply_patch(orjson.loads(profile_json), operations)
+            return MASTER_ADAPTER.validate_python(patched)
+        except _PATCH_ERRORS as e:
+            logger.warning("Tailoring patch could not be applied (%s). Requesting the full profile.", e)
 
-        Instructions:
-        1. **Summary:** Rewrite the candidate's summary (`basics.summary`) to align with the Role Mission and Keywords. Keep it professional and under 4 lines.
-        2. **Work Experience:** 
-           - Select the most relevant work experiences.
-           - For each selected experience, rewrite the `highlights` to emphasize skills and achievements relevant to the JD.
-           - Use the keywords from the analysis.
-           - Keep the original `company`, `position`, `startDate`, `endDate`.
-           - You may reorder the highlights.
-        3. **Skills:** Select and prioritize the `skills` list to match the JD's technical requirements.
-        4. **Language:** Ensure the entire resume (summary, bullets, etc.) is written in {language}. If the JD is in a different language, TRANSLATE relevant parts to {language}.
+        return self._get_completion(
+            messages=self._build_messages(self.TAILOR_PREAMBLE, user_text, context=context),
+            adapter=MASTER_ADAPTER,
+            show_progress=True,
+        )
 
-        Return the tailored profile as a JSON object matching the structure of the input Master Profile. 
-        ENSURE all fields required by the schema (like 'basics', 'work', 'education', 'skills') are present and correctly formatted.
-        """
+    def _merge_extracted(self, current_profile: MasterProfile, extracted: MasterProfile) -> MasterProfile | None:
+        """Merges a parsed profile locally, asking the LLM only about conflicts; None if that fails."""
+        merged, conflicts = deterministic_merge(current_profile, extracted)
+        if not conflicts:
+            return merged
 
-        tailored_data = self._get_completion(
-            messages=[{"role": "user", "content": prompt}],
-            json_mode=True
-        )
-        
-        # Validate and return as MasterProfile object
-        # We might need to handle potential schema mismatches, but Pydantic is good at that.
-        return MasterProfile(**tailored_data)
+        logger.info("Resolving %d merge conflict(s)...", len(conflicts))
+        try:
+            resolution_data = self._get_completion(
+                messages=self._build_messages(
+                    self.MERGE_CONFLICTS_PREAMBLE,
+                    "\n".join(("Conflicts:", orjson.dumps([c.model_dump() for c in conflicts]).decode())),
+                ),
+                adapter=_JSON_OBJECT,
+            )
+            allowed = {conflict.path for conflict in conflicts}
+            operations = [
+                {"op": "replace", "path": item["path"], "value": item["value"]}
+                for item in resolution_data["resolutions"]
+                if item["path"] in allowed
+            ]
+            resolved = jsonpatch.apply_patch(merged.model_dump(mode="json"), operations)
+            return MASTER_ADAPTER.validate_python(resolved)
+        except _PATCH_ERRORS as e:
+            logger.warning("Merge conflicts could not be resolved (%s). Requesting the full merge.", e)
+        return None
 
     def merge_profile(self, current_profile: MasterProfile, new_text: str, images: list[str] | None = None) -> MasterProfile:
         """
         Intelligently merges new resume content into an existing Master Profile.
-        
+
+        The new input is parsed on its own and merged locally (fuzzy entry matching, list
+        unions, filling gaps); only the fields where both sides disagree are sent to the LLM.
+        If the new input is not a valid profile on its own (e.g. a note without contact details)
+        or the resolutions cannot be applied, the full-profile merge prompt is used instead.
+
         Args:
             current_profile: The existing MasterProfile object.
             new_text: Text extracted from the new resume file.
             images: Optional list of base64 data URIs (for Vision models).
         """
-        schema = MasterProfile.model_json_schema()
-        current_data = current_profile.model_dump(mode="json")
-        
-        prompt_text = f"""
-        You are an Expert Data Integrator for resumes.
-        Your task is to MERGE new resume data into an existing 'Master Profile' JSON object.
-
-        Current Master Profile:
-        {json.dumps(current_data, indent=2)}
-
-        New Resume Input (Text):
-        {new_text}
-
-        MasterProfile JSON Schema:
-        {json.dumps(schema, indent=2)}
-
-        MERGE RULES:
-        1. **MATCH & ENHANCE:** If a Work Experience or Project already exists (fuzzy match on Company/Project Name and Role), UPDATE it with new details (bullets, tech stack) from the new input. Do NOT create duplicates.
-        2. **ADD NEW:** If an entry found in the New Resume Input is NOT in the Current Profile, ADD it.
-        3. **PRESERVE:** Do NOT remove existing valid details (like old projects, specific bullets) unless the new text explicitly contradicts them or implies they are obsolete. The Master Profile should be a superset of history.
-        4. **BASICS UPDATE:** Update contact info, summary, or location if the new input seems more current.
-        5. **DATES:** Trust specific dates in the New Input if they are more precise than what is in the Current Profile.
-        6. **TECH STACK:** Merge lists of skills/technologies. Avoid duplicates.
-        7. **Output Structure:** You MUST output a valid JSON object strictly adhering to the schema.
-
-        Output ONLY the merged JSON object.
-        """
-
-        if images:
-            # Multimodal message construction
-            content = [{"type": "text", "text": prompt_text}]
-            for img_url in images:
-                content.append({"type": "image_url", "image_url": {"url": img_url}})
-            
-            messages = [
-                {"role": "system", "content": "You are a helpful assistant that merges resume data."},
-                {"role": "user", "content": content}
-            ]
+        try:
+            extracted = self.bootstrap_profile(new_text, images=images)
+        except ValueError as e:
+            # e.g. a short note ("also add project X") has no name or email of its own.
+            logger.warning("New input is not a complete profile on its own (%s). Requesting the full merge.", e)
         else:
-            # Standard text-only
-            messages = [
-                {"role": "system", "content": "You are a helpful assistant that merges resume data."},
-                {"role": "user", "content": prompt_text}
-            ]
+            merged = self._merge_extracted(current_profile, extracted)
+            if merged is not None:
+                return merged
+
+        current_json = _profile_json(current_profile)
+        messages = self._fit_context(
+            lambda text: self._build_messages(
+                self.MERGE_PREAMBLE,
+                "\n".join(("Current Master Profile:", current_json, "", "New Resume Input (Text):", text)),
+                images=images,
+            ),
+            new_text,
+        )
 
-        merged_data = self._get_completion(
+        return self._get_completion(
             messages=messages,
-            json_mode=True
+            adapter=MASTER_ADAPTER,
+            show_progress=True,
         )
 
-        return MasterProfile(**merged_data)
+if __name__ == "__main__":
+    import importlib.util
 
+    import httpx
+    from rich.console import Console
+    from rich.logging import RichHandler
 
-if __name__ == "__main__":
+    console = Console()
+    logging.basicConfig(format="%(message)s", handlers=[RichHandler(console=console, show_path=False)])
+    logger.setLevel(logging.INFO)
+    logging.getLogger("resume_mate").setLevel(logging.INFO)
     load_dotenv(".env.local")
 
-    agent = ResumeAgent(
-        model_name=os.getenv("LITELLM_MODEL_NAME", "gpt-4o"),
-        api_key=os.getenv("LITELLM_API_KEY"),
-        api_base=os.getenv("LITELLM_PROXY_BASE_URL"),
-    )
-    
-    jd_text = "We are looking for a Senior Software Engineer with experience in Python, FastAPI, and cloud technologies."
-    
-    try:
-        jd_analysis = agent.analyze_job_description(jd_text)
-        console.print(jd_analysis)
-    except Exception as e:
-        console.print(f"[bold red]Failed to run analysis:[/bold red] {e}")
\ No newline at end of file
+    jd_texts = [
+        "We are looking for a Senior Software Engineer with experience in Python, FastAPI, and cloud technologies.",
+        "We are hiring a Data Engineer to build streaming pipelines with Kafka, Spark, and Airflow.",
+    ]
+
+    async def main() -> None:
+        # One pooled client for every async call; HTTP/2 multiplexes them over a single
+        # connection when the optional `h2` package is installed.
+        client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        litellm.aclient_session = client
+
+        agent = ResumeAgent(
+            model_name=os.getenv("LITELLM_MODEL_NAME", "gpt-4o"),
+            api_key=os.getenv("LITELLM_API_KEY"),
+            api_base=os.getenv("LITELLM_PROXY_BASE_URL"),
+        )
+
+        # The health check runs alongside the analyses, so it doubles as a connection warmup.
+        try:
+            health, analyses = await asyncio.gather(
+                litellm.ahealth_check(
+                    model_params={"model": agent.model_name, "api_key": agent.api_key, "api_base": agent.api_base}
+                ),
+                agent.analyze_many(jd_texts),
+                return_exceptions=True,
+            )
+        finally:
+            await client.aclose()
+
+        if isinstance(health, BaseException):
+            logger.warning("Health check failed: %s", health)
+        else:
+            console.print(health)
+        if isinstance(analyses, BaseException):
+            logger.error("Failed to run analysis: %s", analyses)
+        else:
+            for jd_analysis in analyses:
+                console.print(jd_analysis)
+
+    asyncio.run(main())
@@ -0,0 +1,217 @@
+import hashlib
+import logging
+import math
+import sqlite3
+import time
+from array import array
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+import litellm
+import orjson
+
+from resume_mate.utils.cache import CACHE_ROOT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = CACHE_ROOT / "llm-responses.sqlite3"
+
+
+def _canonical_json(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+
+
+def _last_user_text(messages: list[dict[str, Any]]) -> str | None:
+    """Returns the final user message's text, or None for multimodal/empty content."""
+    if not messages or messages[-1].get("role") != "user":
+        return None
+    content = messages[-1].get("content")
+    return content if isinstance(content, str) and content else None
+
+
+class ResponseCache:
+    """
+    Two-tier cache for raw LLM response content.
+
+    1. Exact tier: sha256 of (model, json_mode, messages) -> response, in SQLite.
+    2. Semantic tier (opt-in via `semantic_threshold`): the final user message is
+       embedded and a cached response is reused when a previous request with the same
+       model, json_mode and leading (system) messages has cosine similarity at or above
+       the threshold.
+
+    Cache failures never break a completion; they are reported and treated as misses.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl: float = 7 * 24 * 3600,
+        semantic_threshold: float | None = None,
+        embedding_model: str = "text-embedding-3-small",
+        api_key: str | None = None,
+        api_base: str | None = None,
+    ):
+        self.path: Path | None = path or DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        self.semantic_threshold = semantic_threshold
+        self.embedding_model = embedding_model
+        self.api_key = api_key
+        self.api_base = api_base
+        # Embeddings computed on a miss are reused when the response is stored.
+        self._pending_vectors: dict[str, list[float]] = {}
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        assert self.path is not None
+        return sqlite3.connect(self.path)
+
+    def _init_db(self) -> None:
+        assert self.path is not None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, content TEXT NOT NULL, "
+                    "created_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    "key TEXT PRIMARY KEY, prefix_key TEXT NOT NULL, "
+                    "vector BLOB NOT NULL, created_at REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS embeddings_prefix "
+                    "ON embeddings (prefix_key)"
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("LLM response cache disabled: %s", e)
+            self.semantic_threshold = None
+            self.path = None
+
+    @staticmethod
+    def make_key(messages: list[dict[str, Any]], model: str, json_mode: bool) -> str:
+        payload = _canonical_json(
+            {"model": model, "json_mode": json_mode, "messages": messages}
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    @staticmethod
+    def _prefix_key(messages: list[dict[str, Any]], model: str, json_mode: bool) -> str:
+        return ResponseCache.make_key(messages[:-1], model, json_mode)
+
+    def get(
+        self, messages: list[dict[str, Any]], model: str, json_mode: bool = True
+    ) -> str | None:
+        """Returns the cached response content for this request, or None on a miss."""
+        if self.path is None:
+            return None
+
+        key = self.make_key(messages, model, json_mode)
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT content, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and time.time() - row[1] <= self.ttl:
+                    return row[0]
+
+                if self.semantic_threshold is not None:
+                    return self._semantic_get(conn, key, messages, model, json_mode)
+        except sqlite3.Error as e:
+            logger.warning("LLM response cache lookup failed: %s", e)
+        return None
+
+    def set(
+        self,
+        messages: list[dict[str, Any]],
+        model: str,
+        content: str,
+        json_mode: bool = True,
+    ) -> None:
+        """Stores the response content for this request."""
+        if self.path is None:
+            return
+
+        key = self.make_key(messages, model, json_mode)
+        vector = self._pending_vectors.pop(key, None)
+        if vector is None and self.semantic_threshold is not None:
+            text = _last_user_text(messages)
+            vector = self._embed(text) if text else None
+
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, content, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, content, now),
+                )
+                if vector is not None:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO embeddings "
+                        "(key, prefix_key, vector, created_at) VALUES (?, ?, ?, ?)",
+                        (
+                            key,
+                            self._prefix_key(messages, model, json_mode),
+                            array("f", vector).tobytes(),
+                            now,
+                        ),
+                    )
+        except sqlite3.Error as e:
+            logger.warning("Failed to write LLM response cache: %s", e)
+
+    def _semantic_get(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        messages: list[dict[str, Any]],
+        model: str,
+        json_mode: bool,
+    ) -> str | None:
+        text = _last_user_text(messages)
+        if text is None or self.semantic_threshold is None:
+            return None
+        query = self._embed(text)
+        if query is None:
+            return None
+        self._pending_vectors[key] = query
+
+        best_key, best_score = None, -1.0
+        rows = conn.execute(
+            "SELECT key, vector FROM embeddings "
+            "WHERE prefix_key = ? AND created_at >= ?",
+            (self._prefix_key(messages, model, json_mode), time.time() - self.ttl),
+        )
+        for candidate_key, blob in rows:
+            vector = array("f")
+            vector.frombytes(blob)
+            # Stored vectors are unit length: the dot product is the cosine.
+            score = math.fsum(a * b for a, b in zip(query, vector, strict=False))
+            if score > best_score:
+                best_key, best_score = candidate_key, score
+
+        if best_key is None or best_score < self.semantic_threshold:
+            return None
+        row = conn.execute(
+            "SELECT content FROM responses WHERE key = ?", (best_key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _embed(self, text: str) -> list[float] | None:
+        """Returns the unit-normalized embedding of `text`, or None on failure."""
+        try:
+            response = litellm.embedding(
+                model=self.embedding_model,
+                input=[text],
+                api_key=self.api_key,
+                api_base=self.api_base,
+            )
+            vector = [float(x) for x in response.data[0]["embedding"]]
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed: %s", e)
+            return None
+
+        norm = math.sqrt(math.fsum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
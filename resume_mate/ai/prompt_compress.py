@@ -0,0 +1,88 @@
+import re
+from typing import Any
+
+import orjson
+
+# Parenthetical examples such as "(e.g., Python, Go)" add tokens without changing the
+# task.
+_EXAMPLE_PARENS = re.compile(r"\s*\((?:e\.g\.|eg\.|for example)[^()]*\)", re.IGNORECASE)
+_INLINE_WHITESPACE = re.compile(r"[ \t]+")
+
+# Schema keys that only carry presentation metadata for humans.
+_SCHEMA_NOISE_KEYS = frozenset({"title", "examples"})
+
+
+def compress(text: str) -> str:
+    """
+    Applies lossless-in-intent rule-based compression to a static prompt block:
+    strips the triple-quoted indentation, collapses runs of spaces, drops blank lines
+    and parenthetical examples.
+    """
+    text = _EXAMPLE_PARENS.sub("", text)
+    lines = (_INLINE_WHITESPACE.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def minify_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns a copy of a JSON schema without `title`/`examples` metadata and without
+    `$defs` entries that are never referenced.
+
+    Field descriptions are kept: they are hand-written hints (e.g. that `name` is the
+    company name) rather than generated noise.
+    """
+    minified = _strip_noise(schema)
+
+    defs = minified.get("$defs")
+    if isinstance(defs, dict):
+        used = _referenced_defs(
+            {k: v for k, v in minified.items() if k != "$defs"}, defs
+        )
+        kept = {name: body for name, body in defs.items() if name in used}
+        if kept:
+            minified["$defs"] = kept
+        else:
+            del minified["$defs"]
+
+    return minified
+
+
+def dumps_schema(schema: dict[str, Any]) -> str:
+    """Minifies a JSON schema and serializes it without insignificant whitespace."""
+    return orjson.dumps(minify_schema(schema)).decode()
+
+
+def _strip_noise(node: Any, in_properties: bool = False) -> Any:
+    if isinstance(node, dict):
+        return {
+            # Keys of a `properties` map are field names (a field may be called
+            # "title").
+            key: _strip_noise(
+                value, in_properties=key == "properties" and not in_properties
+            )
+            for key, value in node.items()
+            if in_properties or key not in _SCHEMA_NOISE_KEYS
+        }
+    if isinstance(node, list):
+        return [_strip_noise(item) for item in node]
+    return node
+
+
+def _referenced_defs(root: dict[str, Any], defs: dict[str, Any]) -> set[str]:
+    """Names of the `$defs` entries reachable from `root` through `$ref` pointers."""
+    prefix = "#/$defs/"
+    used: set[str] = set()
+    pending: list[Any] = [root]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith(prefix):
+                name = ref[len(prefix) :]
+                if name not in used and name in defs:
+                    used.add(name)
+                    pending.append(defs[name])
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+    return used
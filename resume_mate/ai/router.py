@@ -0,0 +1,99 @@
+import os
+import re
+from typing import Any
+
+import litellm
+
+# Tasks that are simple extractions and do not need a flagship model. Full-profile
+# transforms (bootstrap, tailor, merge, suggest) always use the configured model.
+SIMPLE_TASKS = frozenset(
+    {
+        "analyze_job_description",
+        "extract_entity.work",
+        "extract_entity.project",
+        "extract_entity.education",
+        "extract_entity.skill",
+        "summarize_excerpt",
+    }
+)
+
+# Cheap sibling per model family. Routing never crosses providers, so a user who only
+# has an Anthropic key is never sent to OpenAI.
+CHEAP_MODELS = {
+    "gpt": "gpt-4o-mini",
+    "claude": "claude-haiku-4-5",
+    "gemini": "gemini-2.5-flash",
+}
+
+# Providers whose model names are user-chosen deployment names; a sibling name such as
+# "azure/gpt-4o-mini" only exists if the user happened to deploy it, so these are routed
+# only when RESUMEMATE_CHEAP_MODEL names the cheap deployment explicitly.
+DEPLOYMENT_PROVIDERS = frozenset({"azure", "azure_ai", "sagemaker"})
+
+# Name tokens that mark a model as already being the cheap tier. Matched against whole
+# tokens of the name: as a substring, "mini" would also match "gemini".
+CHEAP_TAGS = frozenset({"mini", "haiku", "flash", "nano", "lite"})
+
+# Above this many prompt tokens a "simple" task goes to the configured model anyway.
+MAX_CHEAP_PROMPT_TOKENS = 8000
+
+
+def _cheap_sibling(model: str) -> str | None:
+    provider, _, name = model.rpartition("/")
+    if provider.split("/")[0] in DEPLOYMENT_PROVIDERS:
+        return None
+    if CHEAP_TAGS.intersection(re.split(r"[-.:_@]", name.lower())):
+        return None
+    for family, cheap in CHEAP_MODELS.items():
+        if name.startswith(family):
+            return f"{provider}/{cheap}" if provider else cheap
+    return None
+
+
+def cheap_model(default_model: str, api_base: str | None = None) -> str | None:
+    """
+    Returns the cheaper model to use alongside `default_model`, or None if there is
+    none.
+
+    `RESUMEMATE_CHEAP_MODEL` overrides the cheap model. Without it, requests through a
+    custom `api_base` (e.g. a LiteLLM proxy with its own model aliases) and to providers
+    addressed by deployment name (e.g. `azure/`) have no cheap model.
+    """
+    cheap = os.getenv("RESUMEMATE_CHEAP_MODEL")
+    if not cheap:
+        if api_base:
+            return None
+        cheap = _cheap_sibling(default_model)
+    if not cheap or cheap == default_model:
+        return None
+    return cheap
+
+
+def select_model(
+    task: str,
+    default_model: str,
+    messages: list[dict[str, Any]] | None = None,
+    api_base: str | None = None,
+) -> str:
+    """
+    Picks the model for a task: simple tasks with a small payload go to the
+    `cheap_model`, everything else uses `default_model`.
+    """
+    if task not in SIMPLE_TASKS:
+        return default_model
+
+    cheap = cheap_model(default_model, api_base=api_base)
+    if cheap is None:
+        return default_model
+
+    if messages is not None:
+        try:
+            prompt_tokens = litellm.token_counter(
+                model=default_model, messages=messages
+            )
+        except Exception:
+            prompt_tokens = 0
+        if prompt_tokens > MAX_CHEAP_PROMPT_TOKENS:
+            return default_model
+
+    return cheap
@@ -0,0 +1,326 @@
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+from rapidfuzz import fuzz
+
+from resume_mate.core.models import MASTER_ADAPTER, MasterProfile
+
+# Minimum rapidfuzz score (0-100) for two names to be treated as the same one.
+MATCH_THRESHOLD = 90
+
+
+class Conflict(BaseModel):
+    """A field where the current profile and the new input disagree, with no rule."""
+
+    # JSON Pointer into the merged profile (field names), e.g. "/work/0/summary".
+    path: str
+    current: Any
+    incoming: Any
+
+
+def deterministic_merge(
+    current: MasterProfile, extracted: MasterProfile
+) -> tuple[MasterProfile, list[Conflict]]:
+    """
+    Merges `extracted` (a profile parsed from new input) into `current` using
+    mechanical rules:
+
+    - Work, project, education and skill entries are matched by fuzzy name comparison,
+      and only when their date ranges overlap; unmatched incoming entries are appended,
+      so no history is ever overwritten (e.g. a later role at the same company is a new
+      entry).
+    - Highlights, tech stacks, courses and keywords are merged as ordered, de-duplicated
+      unions; highlights that are rewordings of existing ones (fuzzy match) are dropped.
+    - Missing values are filled in; a date is replaced by a more precise form of itself.
+      An existing profile summary is always kept.
+
+    Anything else where both sides have different values is kept as in `current` and
+    reported as a Conflict, so only those fields need a judgement call.
+    """
+    merged = current.model_dump(mode="json")
+    incoming = extracted.model_dump(mode="json")
+    conflicts: list[Conflict] = []
+
+    _merge_basics(merged["basics"], incoming["basics"], conflicts)
+    _merge_entries(
+        merged["work"], incoming["work"], "/work", _work_score, _merge_work, conflicts
+    )
+    _merge_entries(
+        merged["projects"],
+        incoming["projects"],
+        "/projects",
+        _project_score,
+        _merge_project,
+        conflicts,
+    )
+    _merge_entries(
+        merged["education"],
+        incoming["education"],
+        "/education",
+        _education_score,
+        _merge_education,
+        conflicts,
+    )
+    _merge_entries(
+        merged["skills"],
+        incoming["skills"],
+        "/skills",
+        _skill_score,
+        _merge_skill,
+        conflicts,
+    )
+
+    return MASTER_ADAPTER.validate_python(merged), conflicts
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def _merge_scalar(
+    target: dict[str, Any], key: str, value: Any, path: str, conflicts: list[Conflict]
+) -> None:
+    current = target.get(key)
+    if _is_empty(value) or current == value:
+        return
+    if _is_empty(current):
+        target[key] = value
+    else:
+        conflicts.append(
+            Conflict(path=f"{path}/{key}", current=current, incoming=value)
+        )
+
+
+def _merge_date(
+    target: dict[str, Any],
+    key: str,
+    value: str | None,
+    path: str,
+    conflicts: list[Conflict],
+) -> None:
+    current = target.get(key)
+    if current == value:
+        return
+    if current and value and (value.startswith(current) or current.startswith(value)):
+        # Same date at different precision ("2020" vs "2020-03"): keep the more precise
+        # one.
+        target[key] = max(current, value, key=len)
+    elif current is None and key == "start_date":
+        target[key] = value
+    elif value is None and key == "start_date":
+        return
+    else:
+        # Includes a missing end date on one side, which means "present" rather than
+        # unknown.
+        conflicts.append(
+            Conflict(path=f"{path}/{key}", current=current, incoming=value)
+        )
+
+
+def _union(current: list[str], incoming: list[str]) -> list[str]:
+    """Ordered union; strings differing only in case or surrounding space are equal."""
+    seen = {item.strip().casefold() for item in current}
+    merged = list(current)
+    for item in incoming:
+        folded = item.strip().casefold()
+        if folded not in seen:
+            seen.add(folded)
+            merged.append(item)
+    return merged
+
+
+def _union_highlights(current: list[str], incoming: list[str]) -> list[str]:
+    """
+    Ordered union of bullet points. Bootstrap rewrites every bullet in its own words,
+    so an incoming bullet that closely matches an existing one is a rewording and is
+    dropped.
+    """
+    merged = list(current)
+    for item in incoming:
+        folded = item.strip().casefold()
+        if not any(
+            fuzz.token_sort_ratio(folded, kept.strip().casefold()) >= MATCH_THRESHOLD
+            for kept in merged
+        ):
+            merged.append(item)
+    return merged
+
+
+def _merge_entries(
+    current: list[dict[str, Any]],
+    incoming: list[dict[str, Any]],
+    path: str,
+    score_fn: Callable[[dict[str, Any], dict[str, Any]], float | None],
+    merge_fn: Callable[[dict[str, Any], dict[str, Any], str, list[Conflict]], None],
+    conflicts: list[Conflict],
+) -> None:
+    """Merges each incoming entry into its best-scoring current entry, or appends it."""
+    matched: set[int] = set()
+    for entry in incoming:
+        best_index, best_score = None, 0.0
+        for index, candidate in enumerate(current):
+            if index in matched:
+                continue
+            score = score_fn(candidate, entry)
+            if score is not None and score > best_score:
+                best_index, best_score = index, score
+
+        if best_index is not None:
+            matched.add(best_index)
+            merge_fn(current[best_index], entry, f"{path}/{best_index}", conflicts)
+        else:
+            current.append(entry)
+            matched.add(len(current) - 1)
+
+
+def _name_score(
+    current: str, incoming: str, scorer: Callable[..., float] = fuzz.token_sort_ratio
+) -> float | None:
+    """
+    Similarity of two names, or None below MATCH_THRESHOLD. The default scorer compares
+    all tokens, so "Engineer" and "Senior Engineer" differ; token_set_ratio, which
+    scores a subset as 100, only suits organization names ("Google" vs "Google LLC").
+    """
+    score = scorer(current.strip().casefold(), incoming.strip().casefold())
+    return score if score >= MATCH_THRESHOLD else None
+
+
+def _date_bound(date: str | None, upper: bool) -> str:
+    """
+    Pads an ISO date prefix ("2020", "2020-03") to a comparable day; a missing end date
+    is "present".
+    """
+    if not date:
+        return "9999-12-31" if upper else "0000-01-01"
+    if len(date) not in (4, 7):
+        return date
+    return date + ("-12-31" if upper else "-01-01")[len(date) - 4 :]
+
+
+def _overlaps(current: dict[str, Any], incoming: dict[str, Any]) -> bool:
+    """Whether two entries' date ranges overlap; entries without a start date do."""
+    if not current.get("start_date") or not incoming.get("start_date"):
+        return True
+    current_start, current_end = (
+        _date_bound(current["start_date"], False),
+        _date_bound(current.get("end_date"), True),
+    )
+    incoming_start, incoming_end = (
+        _date_bound(incoming["start_date"], False),
+        _date_bound(incoming.get("end_date"), True),
+    )
+    return current_start <= incoming_end and incoming_start <= current_end
+
+
+def _work_score(current: dict[str, Any], incoming: dict[str, Any]) -> float | None:
+    company = _name_score(current["name"], incoming["name"], fuzz.token_set_ratio)
+    position = _name_score(current["position"], incoming["position"])
+    if company is None or position is None or not _overlaps(current, incoming):
+        return None
+    return company + position
+
+
+def _project_score(current: dict[str, Any], incoming: dict[str, Any]) -> float | None:
+    if not _overlaps(current, incoming):
+        return None
+    return _name_score(current["name"], incoming["name"])
+
+
+def _education_score(current: dict[str, Any], incoming: dict[str, Any]) -> float | None:
+    institution = _name_score(
+        current["institution"], incoming["institution"], fuzz.token_set_ratio
+    )
+    area = _name_score(current["area"], incoming["area"])
+    # A master's right after a bachelor's in the same field is a second degree, not a
+    # duplicate.
+    degree = _name_score(current["study_type"], incoming["study_type"])
+    if (
+        institution is None
+        or area is None
+        or degree is None
+        or not _overlaps(current, incoming)
+    ):
+        return None
+    return institution + area + degree
+
+
+def _skill_score(current: dict[str, Any], incoming: dict[str, Any]) -> float | None:
+    return _name_score(current["name"], incoming["name"])
+
+
+def _merge_work(
+    target: dict[str, Any], entry: dict[str, Any], path: str, conflicts: list[Conflict]
+) -> None:
+    # Matched positions are similar but may still differ (e.g. "Engineer" vs "Engineer
+    # II").
+    for key in ("position", "url", "summary"):
+        _merge_scalar(target, key, entry[key], path, conflicts)
+    for key in ("start_date", "end_date"):
+        _merge_date(target, key, entry[key], path, conflicts)
+    target["highlights"] = _union_highlights(target["highlights"], entry["highlights"])
+    target["tech_stack"] = _union(target["tech_stack"], entry["tech_stack"])
+
+
+def _merge_project(
+    target: dict[str, Any], entry: dict[str, Any], path: str, conflicts: list[Conflict]
+) -> None:
+    for key in ("description", "url"):
+        _merge_scalar(target, key, entry[key], path, conflicts)
+    for key in ("start_date", "end_date"):
+        _merge_date(target, key, entry[key], path, conflicts)
+    target["highlights"] = _union_highlights(target["highlights"], entry["highlights"])
+    target["tech_stack"] = _union(target["tech_stack"], entry["tech_stack"])
+
+
+def _merge_education(
+    target: dict[str, Any], entry: dict[str, Any], path: str, conflicts: list[Conflict]
+) -> None:
+    for key in ("area", "url", "score"):
+        _merge_scalar(target, key, entry[key], path, conflicts)
+    for key in ("start_date", "end_date"):
+        _merge_date(target, key, entry[key], path, conflicts)
+    target["courses"] = _union(target["courses"], entry["courses"])
+
+
+def _merge_skill(
+    target: dict[str, Any], entry: dict[str, Any], path: str, conflicts: list[Conflict]
+) -> None:
+    _merge_scalar(target, "level", entry["level"], path, conflicts)
+    target["keywords"] = _union(target["keywords"], entry["keywords"])
+
+
+def _merge_basics(
+    target: dict[str, Any], incoming: dict[str, Any], conflicts: list[Conflict]
+) -> None:
+    for key in ("name", "label", "email", "phone", "url"):
+        _merge_scalar(target, key, incoming[key], "/basics", conflicts)
+    # Bootstrap writes a summary for every input, so a differing one is not news: an
+    # existing summary is kept (it is rewritten per job by `tailor` anyway) and only a
+    # missing one is filled.
+    if _is_empty(target["summary"]):
+        target["summary"] = incoming["summary"]
+
+    if target["location"] is None:
+        target["location"] = incoming["location"]
+    elif incoming["location"] is not None:
+        for key, value in incoming["location"].items():
+            _merge_scalar(target["location"], key, value, "/basics/location", conflicts)
+
+    networks = {
+        profile["network"].casefold(): index
+        for index, profile in enumerate(target["profiles"])
+    }
+    for profile in incoming["profiles"]:
+        index = networks.get(profile["network"].casefold())
+        if index is None:
+            target["profiles"].append(profile)
+        else:
+            for key in ("username", "url"):
+                _merge_scalar(
+                    target["profiles"][index],
+                    key,
+                    profile[key],
+                    f"/basics/profiles/{index}",
+                    conflicts,
+                )
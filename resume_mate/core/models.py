@@ -1,8 +1,10 @@
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter
+from pydantic.alias_generators import to_camel
 
 
 class BaseSchema(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    # snake_case fields are read and written as camelCase (e.g. start_date <-> startDate).
+    model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
 
 
 class Profile(BaseSchema):
@@ -13,9 +15,9 @@ class Profile(BaseSchema):
 
 class Location(BaseSchema):
     address: str | None = None
-    postal_code: str | None = Field(None, alias="postalCode")
+    postal_code: str | None = None
     city: str
-    country_code: str | None = Field(None, alias="countryCode")
+    country_code: str | None = None
     region: str | None = None
 
 
@@ -34,30 +36,30 @@ class WorkExperience(BaseSchema):
     name: str = Field(..., description="Company name")
     position: str
     url: HttpUrl | None = None
-    start_date: str = Field(..., alias="startDate")
-    end_date: str | None = Field(default=None, alias="endDate")
+    start_date: str
+    end_date: str | None = None
     summary: str | None = None
     highlights: list[str] = Field(default_factory=list)
-    tech_stack: list[str] = Field(default_factory=list, alias="techStack")
+    tech_stack: list[str] = Field(default_factory=list)
 
 
 class Project(BaseSchema):
     name: str
     description: str | None = None
     highlights: list[str] = Field(default_factory=list)
-    tech_stack: list[str] = Field(default_factory=list, alias="techStack")
+    tech_stack: list[str] = Field(default_factory=list)
     url: HttpUrl | None = None
-    start_date: str | None = Field(None, alias="startDate")
-    end_date: str | None = Field(None, alias="endDate")
+    start_date: str | None = None
+    end_date: str | None = None
 
 
 class Education(BaseSchema):
     institution: str
     url: HttpUrl | None = None
     area: str
-    study_type: str = Field(..., alias="studyType")
-    start_date: str = Field(..., alias="startDate")
-    end_date: str | None = Field(None, alias="endDate")
+    study_type: str
+    start_date: str
+    end_date: str | None = None
     score: str | None = None
     courses: list[str] = Field(default_factory=list)
 
@@ -74,3 +76,17 @@ class MasterProfile(BaseSchema):
     projects: list[Project] = Field(default_factory=list)
     education: list[Education] = Field(default_factory=list)
     skills: list[Skill] = Field(default_factory=list)
+
+
+# Entry types that can be added to a profile on their own (see `resume-mate add`).
+ENTITY_MODELS: dict[str, type[BaseSchema]] = {
+    "work": WorkExperience,
+    "project": Project,
+    "education": Education,
+    "skill": Skill,
+}
+
+# Pre-built validators, so hot paths do not rebuild validation state per call and can
+# validate raw JSON bytes directly in pydantic-core.
+MASTER_ADAPTER = TypeAdapter(MasterProfile)
+ENTITY_ADAPTERS = {name: TypeAdapter(model) for name, model in ENTITY_MODELS.items()}
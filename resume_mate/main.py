@@ -1,21 +1,26 @@
-import typer
-from pathlib import Path
-import shutil
-import yaml
-import webbrowser
-from rich.prompt import Confirm
 import os
-from dotenv import load_dotenv
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Load environment variables from .env file
-load_dotenv()
+import typer
+from rich.prompt import Confirm
 
-from resume_mate.utils.console import console, print_yaml_diff
-from resume_mate.utils.file_io import extract_text_from_file, write_yaml
 from resume_mate.core.models import MasterProfile
-from resume_mate.renderer.template import TemplateRenderer
-from resume_mate.renderer.pdf import PdfGenerator
-from resume_mate.ai.agent import ResumeAgent
+from resume_mate.utils.console import configure_logging, console, print_yaml_diff
+from resume_mate.utils.file_io import (
+    dump_yaml,
+    extract_text_from_file,
+    load_profile,
+    write_yaml,
+    write_yaml_str,
+)
+
+# The renderer (Playwright) and the agent (LiteLLM) are slow to import, so commands
+# import them when they need them; `init` and `validate` never do.
+if TYPE_CHECKING:
+    from resume_mate.ai.agent import ResumeAgent
+    from resume_mate.renderer.pdf import PdfGenerator
 
 app = typer.Typer(
     name="resume-mate",
@@ -23,6 +28,35 @@ app = typer.Typer(
     add_completion=False,
 )
 
+
+@app.callback()
+def _setup():
+    configure_logging()
+
+
+def _load_profile_or_exit(profile_file: Path, error: str = "Failed to validate profile") -> MasterProfile:
+    """Loads the profile, printing `error` and exiting if it cannot be read or validated."""
+    try:
+        return load_profile(profile_file)
+    except Exception as e:
+        console.print(f"[error]{error}: {e}[/error]")
+        raise typer.Exit(code=1)
+
+
+def _make_agent(model: str, api_key: str | None, api_base: str | None, no_cache: bool = False) -> ResumeAgent:
+    """
+    Loads .env and creates the agent; only AI commands pay for importing LiteLLM.
+    Unless `no_cache` is set, repeated identical LLM requests are answered from the on-disk response cache.
+    """
+    from dotenv import load_dotenv
+
+    from resume_mate.ai.agent import ResumeAgent
+
+    # Load environment variables from .env file
+    load_dotenv()
+    return ResumeAgent(model_name=model, api_key=api_key, api_base=api_base, use_cache=not no_cache)
+
+
 DEFAULT_PROFILE_YAML = """basics:
   name: "John Doe"
   email: "john@example.com"
@@ -72,13 +106,28 @@ def init(
         profile_path.write_text(DEFAULT_PROFILE_YAML)
         console.print(f"[success]Created {profile_path}[/success]")
 
-def _render_pdf(profile: MasterProfile, theme: str, output: Path):
-    """Helper to render profile to PDF."""
+def _render_pdf(
+    profile: MasterProfile,
+    theme: str,
+    output: Path,
+    profile_dict: dict | None = None,
+    pdf_gen: PdfGenerator | None = None,
+):
+    """
+    Helper to render profile to PDF. Pass `profile_dict` to reuse an existing dump of `profile`,
+    and `pdf_gen` to render on an already launched browser (its output_dir must be output.parent).
+    """
+    from resume_mate.renderer.pdf import PdfGenerator
+    from resume_mate.renderer.template import TemplateRenderer
+
     console.print(f"[info]Rendering resume using theme '{theme}'...[/info]")
     
     try:
         renderer = TemplateRenderer(theme=theme)
-        html_content = renderer.render(profile)
+        if profile_dict is not None:
+            html_content = renderer.render_dict(profile_dict)
+        else:
+            html_content = renderer.render(profile)
     except Exception as e:
         console.print(f"[error]Failed to render template: {e}[/error]")
         raise typer.Exit(code=1)
@@ -86,12 +135,15 @@ def _render_pdf(profile: MasterProfile, theme: str, output: Path):
     console.print(f"[info]Generating PDF at {output}...[/info]")
     
     try:
-        pdf_gen = PdfGenerator(output_dir=str(output.parent))
-        css_path = renderer.theme_path / "styles.css"
-        if not css_path.exists():
-             console.print(f"[warning]CSS file not found at {css_path}. PDF might look unstyled.[/warning]")
+        css_path = renderer.css_path
+        if css_path is None:
+             console.print(f"[warning]CSS file not found at {renderer.theme_path / 'styles.css'}. PDF might look unstyled.[/warning]")
 
-        pdf_gen.generate(html_content, filename=output.name, css_path=css_path)
+        if pdf_gen is not None:
+            pdf_gen.generate(html_content, filename=output.name, css_path=css_path)
+        else:
+            with PdfGenerator(output_dir=str(output.parent)) as pdf_gen:
+                pdf_gen.generate(html_content, filename=output.name, css_path=css_path)
     except Exception as e:
         console.print(f"[error]Failed to generate PDF: {e}[/error]")
         raise typer.Exit(code=1)
@@ -111,13 +163,7 @@ def build(
 
     console.print(f"[info]Loading profile from {profile_file}...[/info]")
     
-    try:
-        with open(profile_file, "r") as f:
-            data = yaml.safe_load(f)
-        profile = MasterProfile(**data)
-    except Exception as e:
-        console.print(f"[error]Failed to validate profile: {e}[/error]")
-        raise typer.Exit(code=1)
+    profile = _load_profile_or_exit(profile_file)
 
     _render_pdf(profile, theme, output)
     console.print(f"[success]Resume built successfully: {output}[/success]")
@@ -137,16 +183,12 @@ def preview(
 
     console.print(f"[info]Loading profile from {profile_file}...[/info]")
     
-    try:
-        with open(profile_file, "r") as f:
-            data = yaml.safe_load(f)
-        profile = MasterProfile(**data)
-    except Exception as e:
-        console.print(f"[error]Failed to validate profile: {e}[/error]")
-        raise typer.Exit(code=1)
+    profile = _load_profile_or_exit(profile_file)
 
     console.print(f"[info]Rendering resume using theme '{theme}'...[/info]")
     try:
+        from resume_mate.renderer.template import TemplateRenderer
+
         renderer = TemplateRenderer(theme=theme)
         html_content = renderer.render(profile)
     except Exception as e:
@@ -158,15 +200,16 @@ def preview(
     console.print(f"[success]HTML generated at {output}[/success]")
 
     # Copy CSS for correct styling
-    css_source = renderer.theme_path / "styles.css"
-    if css_source.exists():
+    if renderer.css_path is not None:
         css_dest = output.parent / "styles.css"
-        shutil.copy(css_source, css_dest)
+        shutil.copy(renderer.css_path, css_dest)
         console.print(f"[info]Copied styles.css to {css_dest}[/info]")
     else:
-        console.print(f"[warning]CSS file not found at {css_source}. Preview might look unstyled.[/warning]")
+        console.print(f"[warning]CSS file not found at {renderer.theme_path / 'styles.css'}. Preview might look unstyled.[/warning]")
 
     console.print(f"[info]Opening {output} in browser...[/info]")
+    import webbrowser
+
     webbrowser.open(f"file://{output.resolve()}")
 
 
@@ -178,6 +221,7 @@ def bootstrap(
     api_key: str = typer.Option(None, "--api-key", "-k", help="API Key for the LLM provider"),
     api_base: str = typer.Option(None, "--api-base", "-b", help="API Base URL"),
     vision: bool = typer.Option(True, "--vision/--no-vision", help="Use vision for PDFs (better layout understanding)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-extract text and images and re-query the LLM instead of reusing results from a previous run"),
 ):
     """
     Bootstrap a master-profile.yaml from an existing resume file using AI.
@@ -193,7 +237,7 @@ def bootstrap(
 
     console.print(f"[info]Extracting text from {input_file}...[/info]")
     try:
-        raw_text = extract_text_from_file(input_file)
+        raw_text = extract_text_from_file(input_file, use_cache=not no_cache)
     except Exception as e:
         console.print(f"[error]Failed to extract text: {e}[/error]")
         raise typer.Exit(code=1)
@@ -203,14 +247,14 @@ def bootstrap(
         try:
             from resume_mate.utils.vision import pdf_to_base64_images
             with console.status("[bold green]Converting PDF to images for Vision analysis...[/bold green]"):
-                images = pdf_to_base64_images(input_file)
+                images = pdf_to_base64_images(input_file, use_cache=not no_cache)
             console.print(f"[info]Generated {len(images)} images from PDF.[/info]")
         except ImportError:
             console.print("[warning]PyMuPDF not installed. Skipping vision.[/warning]")
         except Exception as e:
             console.print(f"[warning]Failed to convert PDF to images: {e}. Falling back to text-only.[/warning]")
 
-    agent = ResumeAgent(model_name=model, api_key=api_key, api_base=api_base)
+    agent = _make_agent(model, api_key, api_base, no_cache=no_cache)
     
     try:
         with console.status("[bold green]Analyzing and converting resume to Master Profile...[/bold green]"):
@@ -234,6 +278,7 @@ def update(
     api_key: str = typer.Option(None, "--api-key", "-k", help="API Key for the LLM provider"),
     api_base: str = typer.Option(None, "--api-base", "-b", help="API Base URL"),
     vision: bool = typer.Option(True, "--vision/--no-vision", help="Use vision for PDFs (better layout understanding)"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-extract text and images and re-query the LLM instead of reusing results from a previous run"),
 ):
     """
     Update an existing master profile by merging content from a new resume file or all files in a directory.
@@ -248,16 +293,10 @@ def update(
 
     # 1. Load Current Profile
     console.print(f"[info]Loading current profile from {profile_file}...[/info]")
-    try:
-        with open(profile_file, "r") as f:
-            current_data = yaml.safe_load(f)
-        current_profile = MasterProfile(**current_data)
-    except Exception as e:
-        console.print(f"[error]Failed to validate existing profile: {e}[/error]")
-        raise typer.Exit(code=1)
+    current_profile = _load_profile_or_exit(profile_file, "Failed to validate existing profile")
     
     # Keep a copy of original for diffing
-    original_yaml = yaml.dump(current_profile.model_dump(mode="json", exclude_none=True, by_alias=True), sort_keys=False)
+    original_yaml = dump_yaml(current_profile.model_dump(mode="json", exclude_none=True, by_alias=True))
 
     # 2. Determine Files to Process
     files_to_process = []
@@ -273,7 +312,7 @@ def update(
         files_to_process = [input_path]
 
     # 3. Initialize Agent
-    agent = ResumeAgent(model_name=model, api_key=api_key, api_base=api_base)
+    agent = _make_agent(model, api_key, api_base, no_cache=no_cache)
     
     # 4. Iterate and Merge
     working_profile = current_profile
@@ -284,7 +323,7 @@ def update(
             
             # Extract Text
             try:
-                raw_text = extract_text_from_file(file_path)
+                raw_text = extract_text_from_file(file_path, use_cache=not no_cache)
             except Exception as e:
                 console.print(f"[error]Failed to extract text from {file_path.name}: {e}. Skipping.[/error]")
                 continue
@@ -295,7 +334,7 @@ def update(
                 try:
                     from resume_mate.utils.vision import pdf_to_base64_images
                     with console.status(f"[bold green]Converting {file_path.name} to images...[/bold green]"):
-                        images = pdf_to_base64_images(file_path)
+                        images = pdf_to_base64_images(file_path, use_cache=not no_cache)
                 except ImportError:
                     console.print("[warning]PyMuPDF not installed. Skipping vision.[/warning]")
                 except Exception as e:
@@ -306,14 +345,15 @@ def update(
                 working_profile = agent.merge_profile(working_profile, raw_text, images=images)
         
         # 5. Show Diff
-        new_yaml = yaml.dump(working_profile.model_dump(mode="json", exclude_none=True, by_alias=True), sort_keys=False)
+        new_dump = working_profile.model_dump(mode="json", exclude_none=True, by_alias=True)
+        new_yaml = dump_yaml(new_dump)
         
         console.print("\n[bold cyan]=== Proposed Changes (Cumulative) ===[/bold cyan]\n")
         print_yaml_diff(original_yaml, new_yaml)
         
         # 6. Confirm & Save
         if Confirm.ask("\nDo you want to apply these changes?"):
-            write_yaml(working_profile.model_dump(mode="json", exclude_none=True, by_alias=True), profile_file)
+            write_yaml_str(new_yaml, profile_file)
             console.print(f"[success]Profile updated successfully: {profile_file}[/success]")
         else:
             console.print("[warning]Update cancelled. No changes made.[/warning]")
@@ -332,6 +372,7 @@ def tailor(
     api_key: str = typer.Option(None, "--api-key", "-k", help="API Key for the LLM provider"),
     api_base: str = typer.Option(None, "--api-base", "-b", help="API Base URL (for proxies or Ollama)"),
     language: str = typer.Option("English", "--language", "-l", help="Target language for the resume"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-query the LLM instead of reusing cached responses"),
 ):
     """
     Tailor the resume to a specific job description using AI.
@@ -346,48 +387,151 @@ def tailor(
 
     # 2. Load Profile
     console.print(f"[info]Loading profile from {profile_file}...[/info]")
-    try:
-        with open(profile_file, "r") as f:
-            data = yaml.safe_load(f)
-        profile = MasterProfile(**data)
-    except Exception as e:
-        console.print(f"[error]Failed to validate profile: {e}[/error]")
-        raise typer.Exit(code=1)
+    profile = _load_profile_or_exit(profile_file)
 
     # 3. Read JD
     jd_text = job_description_file.read_text()
     
     # 4. Initialize Agent
-    agent = ResumeAgent(model_name=model, api_key=api_key, api_base=api_base)
+    agent = _make_agent(model, api_key, api_base, no_cache=no_cache)
     
     # Check for API Key (LiteLLM relies on env vars usually, but we can warn if obviously missing for OpenAI)
     # This is a loose check; other providers might use different keys.
     if "gpt" in model and not api_key and not os.getenv("OPENAI_API_KEY"):
          console.print("[warning]Warning: OPENAI_API_KEY not found in environment variables. tailored generation might fail.[/warning]")
 
-    # 5. Analyze and Tailor
-    try:
-        with console.status("[bold green]Analyzing Job Description...[/bold green]"):
-            analysis = agent.analyze_job_description(jd_text)
-        
-        console.print("[info]Job Analysis Complete. Key terms extracted.[/info]")
-        console.print(f"   [dim]Keywords: {', '.join(analysis.get('keywords', [])[:5])}...[/dim]")
+    from concurrent.futures import ThreadPoolExecutor
+    from contextlib import ExitStack
 
-        with console.status(f"[bold green]Tailoring Resume Content ({language})... (This may take a minute)[/bold green]"):
-            tailored_profile = agent.tailor_profile(profile, analysis, language=language)
-        
+    from resume_mate.renderer.pdf import PdfGenerator
+
+    with ExitStack() as stack:
+        # 5. Analyze and Tailor
+        try:
+            # The analysis runs on a worker thread while Chromium launches here: Playwright's
+            # sync objects must stay on the thread that created them, so the LLM call moves instead.
+            pool = ThreadPoolExecutor(max_workers=1)
+            analysis_future = pool.submit(agent.analyze_job_description, jd_text)
+            pool.shutdown(wait=False)
+
+            with console.status("[bold green]Analyzing Job Description...[/bold green]"):
+                try:
+                    pdf_gen = stack.enter_context(PdfGenerator(output_dir=str(output.parent)))
+                except Exception as e:
+                    console.print(f"[warning]Could not pre-launch the PDF renderer: {e}[/warning]")
+                    pdf_gen = None
+                analysis = analysis_future.result()
+            
+            console.print("[info]Job Analysis Complete. Key terms extracted.[/info]")
+            console.print(f"   [dim]Keywords: {', '.join(analysis.get('keywords', [])[:5])}...[/dim]")
+
+            with console.status(f"[bold green]Tailoring Resume Content ({language})... (This may take a minute)[/bold green]"):
+                tailored_profile = agent.tailor_profile(profile, analysis, language=language)
+            
+        except Exception as e:
+            console.print(f"[error]AI processing failed: {e}[/error]")
+            raise typer.Exit(code=1)
+
+        # 6. Save Tailored YAML (for inspection)
+        yaml_output = output.with_suffix(".yaml")
+        console.print(f"[info]Saving tailored profile data to {yaml_output}...[/info]")
+        tailored_dump = tailored_profile.model_dump(mode="json", exclude_none=True, by_alias=True)
+        write_yaml(tailored_dump, yaml_output)
+
+        # 7. Render PDF on the browser launched during the analysis
+        _render_pdf(tailored_profile, theme, output, profile_dict=tailored_dump, pdf_gen=pdf_gen)
+    console.print(f"[success]Tailored resume built successfully: {output}[/success]")
+
+
+@app.command("tailor-batch")
+def tailor_batch(
+    jd_dir: Path = typer.Argument(..., help="Directory of job description files (*.txt)"),
+    profile_file: Path = typer.Option(Path("master-profile.yaml"), "--input", "-i", help="Path to the master profile YAML"),
+    theme: str = typer.Option("standard", "--theme", "-t", help="Theme to use"),
+    output_dir: Path = typer.Option(Path("output"), "--output-dir", "-o", help="Directory for the tailored PDFs and YAML files"),
+    model: str = typer.Option("gpt-5.2", "--model", "-m", help="LLM model to use (e.g., gpt-5.2, claude-3-5-sonnet)"),
+    api_key: str = typer.Option(None, "--api-key", "-k", help="API Key for the LLM provider"),
+    api_base: str = typer.Option(None, "--api-base", "-b", help="API Base URL (for proxies or Ollama)"),
+    language: str = typer.Option("English", "--language", "-l", help="Target language for the resumes"),
+    workers: int = typer.Option(4, "--workers", "-w", min=1, help="Job descriptions tailored concurrently"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-query the LLM instead of reusing cached responses"),
+):
+    """
+    Tailor the resume to every job description in a directory, writing one PDF per job.
+    """
+    if not profile_file.exists():
+        console.print(f"[error]Profile file {profile_file} not found.[/error]")
+        raise typer.Exit(code=1)
+    if not jd_dir.is_dir():
+        console.print(f"[error]Job description directory {jd_dir} not found.[/error]")
+        raise typer.Exit(code=1)
+
+    jd_files = sorted(jd_dir.glob("*.txt"))
+    if not jd_files:
+        console.print(f"[warning]No job descriptions (*.txt) found in {jd_dir}.[/warning]")
+        return
+
+    # The profile, agent, template and browser are set up once and shared by every job.
+    console.print(f"[info]Loading profile from {profile_file}...[/info]")
+    profile = _load_profile_or_exit(profile_file)
+    agent = _make_agent(model, api_key, api_base, no_cache=no_cache)
+
+    if "gpt" in model and not api_key and not os.getenv("OPENAI_API_KEY"):
+         console.print("[warning]Warning: OPENAI_API_KEY not found in environment variables. tailored generation might fail.[/warning]")
+
+    from concurrent.futures import ThreadPoolExecutor
+    from contextlib import ExitStack
+
+    from resume_mate.renderer.pdf import PdfGenerator
+    from resume_mate.renderer.template import TemplateRenderer
+
+    try:
+        renderer = TemplateRenderer(theme=theme)
     except Exception as e:
-        console.print(f"[error]AI processing failed: {e}[/error]")
+        console.print(f"[error]Failed to load theme '{theme}': {e}[/error]")
         raise typer.Exit(code=1)
 
-    # 6. Save Tailored YAML (for inspection)
-    yaml_output = output.with_suffix(".yaml")
-    console.print(f"[info]Saving tailored profile data to {yaml_output}...[/info]")
-    write_yaml(tailored_profile.model_dump(mode="json", exclude_none=True, by_alias=True), yaml_output)
+    def _tailor_one(jd_file: Path) -> MasterProfile:
+        analysis = agent.analyze_job_description(jd_file.read_text())
+        return agent.tailor_profile(profile, analysis, language=language)
 
-    # 7. Render PDF
-    _render_pdf(tailored_profile, theme, output)
-    console.print(f"[success]Tailored resume built successfully: {output}[/success]")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    failed = 0
+    # The LLM calls are I/O-bound and run on worker threads; Playwright's sync objects must stay
+    # on this thread, so Chromium launches here meanwhile and renders the PDFs one at a time.
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(_tailor_one, jd_file) for jd_file in jd_files]
+        with ExitStack() as stack:
+            try:
+                with console.status("[bold green]Launching the PDF renderer...[/bold green]"):
+                    pdf_gen = stack.enter_context(PdfGenerator(output_dir=str(output_dir)))
+            except Exception as e:
+                console.print(f"[error]Failed to launch the PDF renderer: {e}[/error]")
+                raise typer.Exit(code=1)
+
+            for jd_file, future in zip(jd_files, futures, strict=True):
+                try:
+                    with console.status(f"[bold green]Tailoring for {jd_file.name} ({language})...[/bold green]"):
+                        tailored_profile = future.result()
+                    tailored_dump = tailored_profile.model_dump(mode="json", exclude_none=True, by_alias=True)
+                    write_yaml(tailored_dump, output_dir / f"{jd_file.stem}.yaml")
+                    pdf_path = pdf_gen.generate(
+                        renderer.render_dict(tailored_dump), filename=f"{jd_file.stem}.pdf", css_path=renderer.css_path
+                    )
+                except Exception as e:
+                    failed += 1
+                    console.print(f"[error]{jd_file.name}: {e}[/error]")
+                    continue
+                console.print(f"[success]{jd_file.name} -> {pdf_path}[/success]")
+    finally:
+        # Queued jobs are paid LLM calls: on Ctrl-C or a failed launch they are dropped
+        # instead of run to completion. Jobs already in flight cannot be interrupted.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    console.print(f"[info]Tailored {len(jd_files) - failed} of {len(jd_files)} resumes into {output_dir}.[/info]")
+    if failed:
+        raise typer.Exit(code=1)
 
 
 @app.command()
@@ -398,6 +542,7 @@ def add(
     model: str = typer.Option("gpt-5.2", "--model", "-m", help="LLM model to use"),
     api_key: str = typer.Option(None, "--api-key", "-k", help="API Key"),
     api_base: str = typer.Option(None, "--api-base", "-b", help="API Base URL"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-query the LLM instead of reusing cached responses"),
 ):
     """
     Add a new entry (work, project, education, or skill) to your Master Profile using natural language.
@@ -407,15 +552,9 @@ def add(
         raise typer.Exit(code=1)
 
     # Load Profile
-    try:
-        with open(profile_file, "r") as f:
-            data = yaml.safe_load(f)
-        profile = MasterProfile(**data)
-    except Exception as e:
-        console.print(f"[error]Failed to load profile: {e}[/error]")
-        raise typer.Exit(code=1)
+    profile = _load_profile_or_exit(profile_file, "Failed to load profile")
 
-    agent = ResumeAgent(model_name=model, api_key=api_key, api_base=api_base)
+    agent = _make_agent(model, api_key, api_base, no_cache=no_cache)
     
     try:
         with console.status(f"[bold green]Parsing {entity_type} details...[/bold green]"):
@@ -428,19 +567,19 @@ def add(
             console.print("Cancelled.")
             return
 
-        # Append to profile
+        # Append to a copy of the profile; the loaded one is shared through the load_profile cache.
         if entity_type == "work":
             from resume_mate.core.models import WorkExperience
-            profile.work.append(WorkExperience(**entity_data))
+            profile = profile.model_copy(update={"work": [*profile.work, WorkExperience(**entity_data)]})
         elif entity_type == "project":
             from resume_mate.core.models import Project
-            profile.projects.append(Project(**entity_data))
+            profile = profile.model_copy(update={"projects": [*profile.projects, Project(**entity_data)]})
         elif entity_type == "education":
             from resume_mate.core.models import Education
-            profile.education.append(Education(**entity_data))
+            profile = profile.model_copy(update={"education": [*profile.education, Education(**entity_data)]})
         elif entity_type == "skill":
             from resume_mate.core.models import Skill
-            profile.skills.append(Skill(**entity_data))
+            profile = profile.model_copy(update={"skills": [*profile.skills, Skill(**entity_data)]})
         else:
             console.print(f"[error]Unsupported entity type: {entity_type}[/error]")
             raise typer.Exit(code=1)
@@ -459,6 +598,7 @@ def suggest(
     model: str = typer.Option("gpt-5.2", "--model", "-m", help="LLM model to use"),
     api_key: str = typer.Option(None, "--api-key", "-k"),
     api_base: str = typer.Option(None, "--api-base", "-b"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Re-query the LLM instead of reusing cached responses"),
 ):
     """
     Get AI-powered suggestions and identify gaps in your Master Profile.
@@ -468,15 +608,9 @@ def suggest(
         raise typer.Exit(code=1)
 
     # Load Profile
-    try:
-        with open(profile_file, "r") as f:
-            data = yaml.safe_load(f)
-        profile = MasterProfile(**data)
-    except Exception as e:
-        console.print(f"[error]Failed to load profile: {e}[/error]")
-        raise typer.Exit(code=1)
+    profile = _load_profile_or_exit(profile_file, "Failed to load profile")
 
-    agent = ResumeAgent(model_name=model, api_key=api_key, api_base=api_base)
+    agent = _make_agent(model, api_key, api_base, no_cache=no_cache)
     
     try:
         with console.status("[bold green]Analyzing profile and generating suggestions...[/bold green]"):
@@ -516,9 +650,7 @@ def validate(
     console.print(f"[info]Validating {profile_file}...[/info]")
     
     try:
-        with open(profile_file, "r") as f:
-            data = yaml.safe_load(f)
-        MasterProfile(**data)
+        load_profile(profile_file)
         console.print(f"[success]{profile_file} is valid![/success]")
     except Exception as e:
         console.print(f"[error]Validation failed for {profile_file}:[/error]")
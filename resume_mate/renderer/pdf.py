@@ -1,22 +1,89 @@
-from playwright.sync_api import sync_playwright
 from pathlib import Path
+from typing import Self
+
+from playwright.sync_api import Browser, Playwright, sync_playwright
+
+# Offline HTML-to-PDF needs no GPU, sandbox, extensions or background services;
+# turning them off shortens Chromium start-up and lowers its memory use.
+_CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--no-first-run",
+    "--disable-features=Translate,BackForwardCache",
+]
+
+# Theme stylesheets, read once per process.
+_css_cache: dict[Path, str] = {}
+
+
+def _inline_css(html_content: str, css_path: Path | None) -> str:
+    """Embeds the stylesheet in the document head, so Chromium lays the page out only once."""
+    if not css_path:
+        return html_content
+    css = _css_cache.get(css_path)
+    if css is None:
+        if not css_path.exists():
+            return html_content
+        css = _css_cache[css_path] = css_path.read_text(encoding="utf-8")
+    style = f"<style>{css}</style>"
+    if "</head>" in html_content:
+        return html_content.replace("</head>", f"{style}</head>", 1)
+    return style + html_content
+
 
 class PdfGenerator:
+    """
+    Renders HTML to PDF with headless Chromium.
+
+    Use it as a context manager to keep one browser alive across several renders;
+    launching Chromium costs far more than converting a page. Outside a `with` block,
+    `generate` launches and closes a browser for that single call.
+    """
+
     def __init__(self, output_dir: str = "output"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self._pw: Playwright | None = None
+        self._browser: Browser | None = None
+
+    def __enter__(self) -> Self:
+        self._pw = sync_playwright().start()
+        try:
+            # Signals reach Python instead, and __exit__ closes the browser.
+            self._browser = self._pw.chromium.launch(
+                args=_CHROMIUM_ARGS, handle_sigint=False, handle_sigterm=False, handle_sighup=False
+            )
+        except Exception:
+            self._pw.stop()
+            self._pw = None
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
 
-    def generate(self, html_content: str, filename: str = "resume.pdf", css_path: Path | None = None):
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            page = browser.new_page()
-            
-            # Set content
-            page.set_content(html_content)
-            
-            # Add CSS if provided
-            if css_path and css_path.exists():
-                page.add_style_tag(path=css_path)
+    def generate(self, html_content: str, filename: str = "resume.pdf", css_path: Path | None = None) -> Path:
+        if self._browser is None:
+            with self:
+                return self.generate(html_content, filename=filename, css_path=css_path)
+
+        # A fresh context per document keeps renders isolated; only the browser is shared.
+        context = self._browser.new_context()
+        try:
+            page = context.new_page()
+
+            # Set content with the CSS inlined; there is nothing on the network to wait for.
+            page.set_content(_inline_css(html_content, css_path), wait_until="domcontentloaded")
 
             # Generate PDF
             output_path = self.output_dir / filename
@@ -27,6 +94,13 @@ class PdfGenerator:
                 prefer_css_page_size=True,
                 margin={"top": "0", "right": "0", "bottom": "0", "left": "0"}
             )
-            
-            browser.close()
             return output_path
+        finally:
+            context.close()
+
+    def generate_many(self, documents: list[tuple[str, str]], css_path: Path | None = None) -> list[Path]:
+        """Renders several (html_content, filename) pairs on one browser."""
+        if self._browser is None:
+            with self:
+                return self.generate_many(documents, css_path=css_path)
+        return [self.generate(html, filename=filename, css_path=css_path) for html, filename in documents]
@@ -1,21 +1,52 @@
-from jinja2 import Environment, FileSystemLoader
+import functools
 from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
 from resume_mate.core.models import MasterProfile
 
+# Structure: resume_mate/renderer/../themes/{theme}
+_THEMES_ROOT = Path(__file__).parent.parent / "themes"
+
+# One Environment per theme, so compiled templates are shared by every renderer in the process.
+# The bytecode cache also spares later processes from recompiling the templates.
+_ENV_CACHE: dict[str, Environment] = {}
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_theme(theme: str) -> tuple[Path, Path | None]:
+    """Returns the theme directory and its stylesheet (None if the theme has none), checked once per process."""
+    theme_path = _THEMES_ROOT / theme
+    css_path = theme_path / "styles.css"
+    return theme_path, css_path if css_path.exists() else None
+
+
 class TemplateRenderer:
     def __init__(self, theme: str = "standard"):
         self.theme = theme
-        # Resolve themes directory relative to this file (resume_mate/renderer/template.py)
-        # Structure: resume_mate/renderer/../themes/{theme}
-        self.theme_path = Path(__file__).parent.parent / "themes" / theme
-        self.env = Environment(
-            loader=FileSystemLoader(self.theme_path),
-            autoescape=True
-        )
+        self.theme_path, self.css_path = _resolve_theme(theme)
+        env = _ENV_CACHE.get(theme)
+        if env is None:
+            env = _ENV_CACHE[theme] = Environment(
+                loader=FileSystemLoader(self.theme_path),
+                autoescape=True,
+                auto_reload=False,
+                cache_size=64,
+                bytecode_cache=FileSystemBytecodeCache(),
+            )
+        self.env = env
+        self._template = self.env.get_template("template.html.j2")
 
     def render(self, profile: MasterProfile) -> str:
-        template = self.env.get_template("template.html.j2")
         # Convert Pydantic model to dict for Jinja2
-        # mode='json' ensures things like HttpUrl are converted to strings
-        profile_dict = profile.model_dump(mode='json', by_alias=True)
-        return template.render(**profile_dict)
+        # mode='json' ensures things like HttpUrl are converted to strings; unset fields are
+        # left out so templates render them as empty rather than "None"
+        profile_dict = profile.model_dump(mode='json', exclude_none=True, by_alias=True)
+        return self.render_dict(profile_dict)
+
+    def render_dict(self, profile_dict: dict) -> str:
+        """
+        Renders an already dumped profile, e.g. one also written to YAML. It must be dumped
+        the way `render` does (mode='json', exclude_none=True, by_alias=True) to render the same.
+        """
+        return self._template.render(**profile_dict)
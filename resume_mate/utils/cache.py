@@ -0,0 +1,74 @@
+import functools
+import hashlib
+import os
+import pathlib
+from collections.abc import Callable
+from typing import Any
+
+import platformdirs
+
+CACHE_ROOT = pathlib.Path(platformdirs.user_cache_dir("resume-mate"))
+
+# Text and page images extracted from input files.
+EXTRACTION_CACHE_DIR = CACHE_ROOT / "extracted"
+
+
+def content_key(path: pathlib.Path, *parts: Any) -> str:
+    """sha256 of the file's bytes plus `parts`; edited files or new parameters miss."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(repr(parts).encode())
+    return digest.hexdigest()
+
+
+def cache_by_content(
+    lines: bool = False,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Caches `fn(path, **kwargs)` on disk, keyed by the file's content, the function and
+    its kwargs.
+
+    The result is a string, or a list of single-line strings when `lines` is set (stored
+    newline-separated). Callers pass `use_cache=False` to bypass the cache. Cache I/O
+    errors are ignored; the function is simply called.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(
+            path: pathlib.Path, *, use_cache: bool = True, **kwargs: Any
+        ) -> Any:
+            if not use_cache:
+                return fn(path, **kwargs)
+
+            try:
+                key = content_key(
+                    path, fn.__module__, fn.__qualname__, sorted(kwargs.items())
+                )
+                cache_file = EXTRACTION_CACHE_DIR / f"{key}.txt"
+                if cache_file.exists():
+                    text = cache_file.read_text(encoding="utf-8", newline="")
+                    if not lines:
+                        return text
+                    return text.split("\n") if text else []
+            except OSError:
+                return fn(path, **kwargs)
+
+            result = fn(path, **kwargs)
+            try:
+                EXTRACTION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # Write then rename, so a concurrent reader never sees a partial entry.
+                tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(
+                    "\n".join(result) if lines else result, encoding="utf-8", newline=""
+                )
+                tmp.replace(cache_file)
+            except OSError:
+                pass
+            return result
+
+        return wrapper
+
+    return decorator
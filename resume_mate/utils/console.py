@@ -1,7 +1,11 @@
+import difflib
+import io
+import logging
+
 from rich.console import Console
-from rich.theme import Theme
+from rich.logging import RichHandler
 from rich.syntax import Syntax
-import difflib
+from rich.theme import Theme
 
 custom_theme = Theme({
     "info": "dim cyan",
@@ -12,6 +16,17 @@ custom_theme = Theme({
 
 console = Console(theme=custom_theme)
 
+def configure_logging(level: int = logging.INFO):
+    """
+    Routes the library's log records (LLM warnings, progress) to the CLI console.
+    The library modules only log; handlers are attached here so importing them stays cheap.
+    """
+    logger = logging.getLogger("resume_mate")
+    if not logger.handlers:
+        logger.addHandler(RichHandler(console=console, show_time=False, show_path=False))
+    logger.setLevel(level)
+    logger.propagate = False
+
 def print_yaml_diff(old_yaml: str, new_yaml: str):
     """
     Computes and prints a colored diff between two YAML strings.
@@ -23,11 +38,18 @@ def print_yaml_diff(old_yaml: str, new_yaml: str):
         tofile="New Profile",
         lineterm=""
     )
-    diff_text = "\n".join(list(diff))
-    
-    if not diff_text:
+    # Write the diff lines straight into one buffer instead of materializing a list and joining it.
+    buf = io.StringIO()
+    empty = True
+    for line in diff:
+        if not empty:
+            buf.write("\n")
+        buf.write(line)
+        empty = False
+
+    if empty:
         console.print("[info]No changes detected.[/info]")
         return
 
-    syntax = Syntax(diff_text, "diff", theme="monokai", line_numbers=True)
-    console.print(syntax)
\ No newline at end of file
+    syntax = Syntax(buf.getvalue(), "diff", theme="monokai", line_numbers=True, word_wrap=False)
+    console.print(syntax)
@@ -1,30 +1,80 @@
+import functools
+import os
 import pathlib
 from typing import Any
 
 import yaml
-from pypdf import PdfReader
-from docx import Document
+
+from resume_mate.core.models import MasterProfile
+from resume_mate.utils.cache import cache_by_content
+from resume_mate.utils.parallel import map_page_ranges
+
+# Text extraction takes ~20 ms a page; below this, starting worker processes costs more than it saves.
+PARALLEL_TEXT_MIN_PAGES = 8
+
+# Prefer the LibYAML C bindings; they are an order of magnitude faster and equally safe.
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+
+def load_yaml(text: str) -> Any:
+    """Parses a YAML string."""
+    return yaml.load(text, Loader=_Loader)
+
+
+def dump_yaml(data: Any) -> str:
+    """Serializes data to a YAML string, keeping key order."""
+    return yaml.dump(data, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
 
 
 def read_yaml(path: str | pathlib.Path) -> Any:
     """Reads a YAML file."""
     with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_Loader)
 
 
 def write_yaml(data: Any, path: str | pathlib.Path) -> None:
     """Writes data to a YAML file."""
     with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, sort_keys=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
+
+
+def write_yaml_str(text: str, path: str | pathlib.Path) -> None:
+    """Writes YAML already serialized with `dump_yaml`, e.g. text that was also shown as a diff."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
 
+@functools.lru_cache(maxsize=8)
+def _load_profile_cached(path_str: str, mtime_ns: int) -> MasterProfile:
+    # Validation runs in pydantic-core and costs far less than parsing the YAML; a
+    # model_construct walk over the nested models was measured to be ~20x slower.
+    return MasterProfile.model_validate(read_yaml(path_str))
 
-def extract_text_from_file(path: str | pathlib.Path) -> str:
-    """Extracts text from PDF, Docx, or TXT file."""
+
+def load_profile(path: str | pathlib.Path) -> MasterProfile:
+    """
+    Reads and validates a master profile YAML file.
+
+    Results are cached per (path, modification time), so repeated loads in one process are
+    free and an edited file is re-read. The returned profile is shared: treat it as immutable
+    and use `model_copy(update=...)` to change it.
+    """
+    path = pathlib.Path(path).resolve()
+    return _load_profile_cached(os.fspath(path), path.stat().st_mtime_ns)
+
+
+def extract_text_from_file(path: str | pathlib.Path, use_cache: bool = True) -> str:
+    """Extracts text from PDF, Docx, or TXT file. PDF text is cached by file content unless `use_cache` is False."""
     path = pathlib.Path(path)
     suffix = path.suffix.lower()
 
     if suffix == ".pdf":
-        return _extract_text_from_pdf(path)
+        return _extract_text_from_pdf(path, use_cache=use_cache)
     elif suffix == ".docx":
         return _extract_text_from_docx(path)
     elif suffix in [".txt", ".md"]:
@@ -33,16 +83,33 @@ def extract_text_from_file(path: str | pathlib.Path) -> str:
         raise ValueError(f"Unsupported file format: {suffix}")
 
 
+def _extract_page_range(path: str, start: int, stop: int) -> list[str]:
+    """Worker for `map_page_ranges`."""
+    import pymupdf
+
+    with pymupdf.open(path) as doc:
+        return [doc.load_page(i).get_text("text", sort=True) for i in range(start, stop)]
+
+
+@cache_by_content()
 def _extract_text_from_pdf(path: pathlib.Path) -> str:
-    """Extracts text from a PDF file."""
-    reader = PdfReader(path)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() + "\n"
-    return text
+    """
+    Extracts text from a PDF file, in reading order (sort=True helps multi-column layouts).
+    Documents of PARALLEL_TEXT_MIN_PAGES or more are split across worker processes.
+    """
+    import pymupdf
+
+    with pymupdf.open(path) as doc:
+        page_count = doc.page_count
+        if page_count < PARALLEL_TEXT_MIN_PAGES:
+            return "\n".join(page.get_text("text", sort=True) for page in doc)
+
+    return "\n".join(map_page_ranges(_extract_page_range, os.fspath(path), page_count))
 
 
 def _extract_text_from_docx(path: pathlib.Path) -> str:
     """Extracts text from a Docx file."""
+    from docx import Document
+
     doc = Document(path)
     return "\n".join([para.text for para in doc.paragraphs])
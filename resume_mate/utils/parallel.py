@@ -0,0 +1,34 @@
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+
+def map_page_ranges[T](
+    worker: Callable[..., list[T]],
+    path: str,
+    page_count: int,
+    *args: Any,
+    max_workers: int = 8,
+) -> list[T]:
+    """
+    Runs `worker(path, *args, start, stop)` over contiguous page ranges in separate
+    processes and concatenates the results in page order.
+
+    PyMuPDF documents cannot be shared across threads, so each worker process opens its
+    own handle from `path`. With a single CPU the whole range runs in this process.
+    """
+    workers = min(max_workers, os.cpu_count() or 1, page_count)
+    if workers < 2:
+        return worker(path, *args, 0, page_count)
+
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = executor.map(
+            worker,
+            [path] * workers,
+            *([arg] * workers for arg in args),
+            bounds[:-1],
+            bounds[1:],
+        )
+        return [item for part in parts for item in part]
@@ -0,0 +1,4 @@
+import os
+
+# Keep LiteLLM from fetching its model cost map over the network on import.
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
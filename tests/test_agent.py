@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from resume_mate.ai import agent as agent_module
+from resume_mate.ai.agent import ResumeAgent
+from resume_mate.core.models import MasterProfile
+
+PROFILE = MasterProfile.model_validate(
+    {
+        "basics": {
+            "name": "Ada Lovelace",
+            "email": "ada@example.com",
+            "summary": "Engineer.",
+        },
+        "work": [{"name": "Acme", "position": "Engineer", "start_date": "2020-01"}],
+    }
+)
+
+
+@pytest.fixture
+def replies(monkeypatch):
+    """Queues raw LLM response texts; each completion call consumes the next one."""
+    queue: list[str] = []
+
+    def fake_call_llm(**kwargs):
+        message = SimpleNamespace(content=queue.pop(0))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(agent_module, "_call_llm", fake_call_llm)
+    return queue
+
+
+@pytest.fixture
+def agent():
+    return ResumeAgent(
+        api_key="test", use_cache=False, stream=False, route_simple_tasks=False
+    )
+
+
+def test_tailor_applies_a_bare_operations_array(agent, replies):
+    replies.append(
+        '[{"op": "replace", "path": "/basics/summary", "value": "Tailored."}]'
+    )
+
+    tailored = agent.tailor_profile(PROFILE, {"keywords": ["python"]})
+
+    assert tailored.basics.summary == "Tailored."
+    assert replies == []
+
+
+@pytest.mark.parametrize(
+    "patch_reply",
+    [
+        '"not a patch"',
+        '{"patch": "[{\\"op\\": \\"replace\\"}]"}',
+        '{"patch": [{"op": "replace", "path": "/work/5/position", "value": "CTO"}]}',
+    ],
+)
+def test_tailor_falls_back_to_the_full_profile(agent, replies, patch_reply):
+    full = PROFILE.model_copy(
+        update={"basics": PROFILE.basics.model_copy(update={"summary": "Full."})}
+    )
+    replies.extend([patch_reply, full.model_dump_json(by_alias=True)])
+
+    tailored = agent.tailor_profile(PROFILE, {"keywords": ["python"]})
+
+    assert tailored.basics.summary == "Full."
+    assert replies == []
+
+
+def test_merge_falls_back_when_conflicts_cannot_be_resolved(agent, replies):
+    extracted = PROFILE.model_copy(
+        update={"basics": PROFILE.basics.model_copy(update={"email": "ada@new.dev"})}
+    )
+    merged = PROFILE.model_copy(
+        update={"basics": PROFILE.basics.model_copy(update={"phone": "123"})}
+    )
+    replies.extend(
+        [
+            extracted.model_dump_json(by_alias=True),
+            orjson.dumps([{"path": "/basics/email", "value": "ada@new.dev"}]).decode(),
+            merged.model_dump_json(by_alias=True),
+        ]
+    )
+
+    result = agent.merge_profile(PROFILE, "New resume text")
+
+    assert result.basics.phone == "123"
+    assert replies == []
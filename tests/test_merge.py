@@ -0,0 +1,242 @@
+from resume_mate.core.merge import deterministic_merge
+from resume_mate.core.models import MasterProfile
+
+
+def _profile(**sections) -> MasterProfile:
+    basics = sections.pop("basics", {})
+    return MasterProfile.model_validate(
+        {
+            "basics": {"name": "Ada Lovelace", "email": "ada@example.com", **basics},
+            **sections,
+        }
+    )
+
+
+def _work(name, position, start_date, end_date=None, **fields):
+    return {
+        "name": name,
+        "position": position,
+        "start_date": start_date,
+        "end_date": end_date,
+        **fields,
+    }
+
+
+def test_later_role_at_same_company_is_a_new_entry():
+    current = _profile(work=[_work("Google", "Engineer", "2015-01", "2019-12")])
+    extracted = _profile(work=[_work("Google", "Senior Engineer", "2020-01")])
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert conflicts == []
+    assert [(w.position, w.start_date, w.end_date) for w in merged.work] == [
+        ("Engineer", "2015-01", "2019-12"),
+        ("Senior Engineer", "2020-01", None),
+    ]
+
+
+def test_same_title_in_a_disjoint_period_is_a_new_entry():
+    current = _profile(work=[_work("Acme", "Engineer", "2012", "2014")])
+    extracted = _profile(work=[_work("Acme Inc", "Engineer", "2018-03", "2020-01")])
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert conflicts == []
+    assert len(merged.work) == 2
+
+
+def test_same_role_is_merged():
+    current = _profile(
+        work=[
+            _work(
+                "Google",
+                "Software Engineer",
+                "2015",
+                "2019-12",
+                highlights=["Built search"],
+                tech_stack=["Go"],
+            )
+        ]
+    )
+    extracted = _profile(
+        work=[
+            _work(
+                "Google LLC",
+                "Software Engineer",
+                "2015-01",
+                "2019-12",
+                summary="Search infrastructure",
+                highlights=["built search", "Cut latency by 30%"],
+                tech_stack=["go", "C++"],
+            )
+        ]
+    )
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert conflicts == []
+    [work] = merged.work
+    assert work.name == "Google"
+    assert work.start_date == "2015-01"
+    assert work.summary == "Search infrastructure"
+    assert work.highlights == ["Built search", "Cut latency by 30%"]
+    assert work.tech_stack == ["Go", "C++"]
+
+
+def test_differing_position_is_reported():
+    current = _profile(
+        work=[_work("Google", "Software Engineer", "2015-01", "2019-12")]
+    )
+    extracted = _profile(
+        work=[_work("Google", "Software Engineer II", "2015-01", "2019-12")]
+    )
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert len(merged.work) == 1
+    assert merged.work[0].position == "Software Engineer"
+    assert [(c.path, c.current, c.incoming) for c in conflicts] == [
+        ("/work/0/position", "Software Engineer", "Software Engineer II")
+    ]
+
+
+def test_ended_role_versus_present_is_reported():
+    current = _profile(work=[_work("Google", "Engineer", "2015-01")])
+    extracted = _profile(work=[_work("Google", "Engineer", "2015-01", "2019-12")])
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert merged.work[0].end_date is None
+    assert [(c.path, c.current, c.incoming) for c in conflicts] == [
+        ("/work/0/end_date", None, "2019-12")
+    ]
+
+
+def test_basics_fill_gaps_and_report_disagreements():
+    current = _profile(basics={"profiles": [{"network": "GitHub", "username": "ada"}]})
+    extracted = _profile(
+        basics={
+            "email": "ada@lovelace.dev",
+            "phone": "+44 20 0000 0000",
+            "profiles": [
+                {"network": "github", "username": "ada"},
+                {"network": "LinkedIn", "username": "ada-l"},
+            ],
+        }
+    )
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert merged.basics.email == "ada@example.com"
+    assert merged.basics.phone == "+44 20 0000 0000"
+    assert [p.network for p in merged.basics.profiles] == ["GitHub", "LinkedIn"]
+    assert [(c.path, c.incoming) for c in conflicts] == [
+        ("/basics/email", "ada@lovelace.dev")
+    ]
+
+
+def test_skills_match_whole_names():
+    current = _profile(skills=[{"name": "React", "keywords": ["Hooks"]}])
+    extracted = _profile(
+        skills=[
+            {"name": "react", "keywords": ["hooks", "Redux"]},
+            {"name": "React Native", "keywords": ["Expo"]},
+        ]
+    )
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert conflicts == []
+    assert [(s.name, s.keywords) for s in merged.skills] == [
+        ("React", ["Hooks", "Redux"]),
+        ("React Native", ["Expo"]),
+    ]
+
+
+def test_second_degree_is_a_new_education_entry():
+    current = _profile(
+        education=[
+            {
+                "institution": "MIT",
+                "area": "Computer Science",
+                "study_type": "BSc",
+                "start_date": "2010",
+                "end_date": "2014",
+            }
+        ]
+    )
+    extracted = _profile(
+        education=[
+            {
+                "institution": "MIT",
+                "area": "Computer Science",
+                "study_type": "MSc",
+                "start_date": "2014-09",
+                "end_date": "2016-06",
+            },
+            {
+                "institution": "MIT",
+                "area": "Computer Science",
+                "study_type": "BSc",
+                "start_date": "2010-09",
+                "end_date": "2014-06",
+                "courses": ["Algorithms"],
+            },
+        ]
+    )
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert conflicts == []
+    assert [(e.study_type, e.start_date, e.courses) for e in merged.education] == [
+        ("BSc", "2010-09", ["Algorithms"]),
+        ("MSc", "2014-09", []),
+    ]
+
+
+def test_reworded_highlights_are_not_duplicated():
+    current = _profile(
+        work=[
+            _work(
+                "Acme",
+                "Engineer",
+                "2020-01",
+                highlights=["Reduced API latency by 40%."],
+            )
+        ]
+    )
+    extracted = _profile(
+        work=[
+            _work(
+                "Acme",
+                "Engineer",
+                "2020-01",
+                highlights=[
+                    "reduced API latency by 40%",
+                    "Led a team of four engineers",
+                ],
+            )
+        ]
+    )
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert conflicts == []
+    assert merged.work[0].highlights == [
+        "Reduced API latency by 40%.",
+        "Led a team of four engineers",
+    ]
+
+
+def test_existing_summary_is_kept():
+    current = _profile(basics={"summary": "Backend engineer."})
+    extracted = _profile(basics={"summary": "Results-driven backend engineer."})
+
+    merged, conflicts = deterministic_merge(current, extracted)
+
+    assert conflicts == []
+    assert merged.basics.summary == "Backend engineer."
+    assert (
+        deterministic_merge(_profile(), extracted)[0].basics.summary
+        == "Results-driven backend engineer."
+    )
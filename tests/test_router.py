@@ -0,0 +1,45 @@
+import pytest
+
+from resume_mate.ai.router import cheap_model, select_model
+
+
+@pytest.fixture(autouse=True)
+def no_cheap_model_override(monkeypatch):
+    monkeypatch.delenv("RESUMEMATE_CHEAP_MODEL", raising=False)
+
+
+@pytest.mark.parametrize(
+    ("model", "cheap"),
+    [
+        ("gpt-5.2", "gpt-4o-mini"),
+        ("claude-sonnet-4-5", "claude-haiku-4-5"),
+        ("gemini-2.5-pro", "gemini-2.5-flash"),
+        ("vertex_ai/gemini-2.5-pro", "vertex_ai/gemini-2.5-flash"),
+        (
+            "openrouter/anthropic/claude-sonnet-4",
+            "openrouter/anthropic/claude-haiku-4-5",
+        ),
+        ("gpt-4o-mini", None),
+        ("gpt-4.1-nano", None),
+        ("gemini-2.5-flash", None),
+        ("claude-3-5-haiku-20241022", None),
+        ("azure/gpt-5.2", None),
+        ("ollama/llama3", None),
+    ],
+)
+def test_cheap_model(model, cheap):
+    assert cheap_model(model) == cheap
+
+
+def test_cheap_model_override(monkeypatch):
+    monkeypatch.setenv("RESUMEMATE_CHEAP_MODEL", "azure/my-mini")
+    assert cheap_model("azure/gpt-5.2") == "azure/my-mini"
+
+
+def test_custom_api_base_is_not_routed():
+    assert cheap_model("gpt-5.2", api_base="http://localhost:4000") is None
+
+
+def test_select_model_routes_only_simple_tasks():
+    assert select_model("analyze_job_description", "gpt-5.2") == "gpt-4o-mini"
+    assert select_model("tailor_profile", "gpt-5.2") == "gpt-5.2"